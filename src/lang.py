@@ -7,6 +7,7 @@ Description: Localization.
 from typing import Dict
 import locale as _locale
 import os
+import re
 
 # Default locale has a different implementation for non-windows.
 import ctypes
@@ -88,11 +89,20 @@ def _getTranslationsFromFile(filepath: str) -> Dict[str, str]:
         translations[split[0].strip()] = split[1].strip()
     return translations
 
+# Maximum amount of strings that each Lang object will cache.
+# When a cache is full it is cleared.
+CACHE_SIZE = 1024
+
 # Valid characters which can be used in keys
 import string
 _KEY_CHARACTERS_ = string.ascii_letters + string.digits
 del string
 
+# Matches either an escaped # (\#) or a key. A key is a # followed by any
+# amount of key characters. If a key is directly followed by another # then
+# that # ends the key and is kept as is (it does not start a new key).
+_KEY_PATTERN_ = re.compile(r"\\#|#([%s]*)(#?)" % _KEY_CHARACTERS_)
+
 class Lang:
     @classmethod
     def blank(cls) -> "Lang":
@@ -125,6 +135,20 @@ class Lang:
         self.locale = locale
         self.translations = translations
 
+        # Strings that contain no keys, these translate to themselves.
+        self._literal_cache = set()
+
+        # string -> translated string
+        self._cache: Dict[str, str] = {}
+
+    def clearCache(self) -> None:
+        """
+        Clears cached translations.
+        Call this after modifying `translations`.
+        """
+        self._literal_cache.clear()
+        self._cache.clear()
+
     def translateKey(self, string: str) -> str:
         """
         Translates a single key.
@@ -137,45 +161,51 @@ class Lang:
         return self.translations.get(key, string)
 
     def translate(self, string: str) -> str:
+        if string in self._literal_cache:
+            return string
+
         # If there is no # in a string it's safe to say that
         # the string contains no keys.
         if "#" not in string:
+            if len(self._literal_cache) >= CACHE_SIZE:
+                self._literal_cache.clear()
+            self._literal_cache.add(string)
             return string
 
-        # Iterate through the string translating as we come across "#"
-        translated = ""
-        key = ""
-        keyFound = False
-
-        # Use the previous char to check for escaped # (\#)
-        prevC = ""
-
-        for c in string:
-            if c == "#" and prevC == "\\":
-                # Remove the escape character.
-                prevC = c
-                translated = translated[:len(translated)-1] + prevC # prevC == "#"
-                continue
-            elif c == "#" and prevC != "\\" and not keyFound:
-                keyFound = True
-                continue
-            elif keyFound:
-                if c not in _KEY_CHARACTERS_:
-                    keyFound = False
-                    translated += self.translateKey(key)
-                    key = ""
-                else:
-                    key += c
-                    continue
-
-            prevC = c
-            translated += c
-
-        if keyFound:
-            # String ended in the middle of a key so try to translate it.
-            translated += self.translateKey(key)
+        cache = self._cache
+        translated = cache.get(string, None)
+
+        if translated is None:
+            translated = self._translate(string)
+
+            if len(cache) >= CACHE_SIZE:
+                cache.clear()
+            cache[string] = translated
+
         return translated
 
+    def _translate(self, string: str) -> str:
+        """
+        Translates a string which contains keys.
+        Used internally by translate()
+        """
+        get = self.translations.get
+
+        def replace(match: "re.Match") -> str:
+            key, end = match.group(1, 2)
+
+            if key is None:
+                # Escaped # (\#), remove the escape character.
+                return "#"
+            elif not key:
+                # Empty keys are removed.
+                return end
+
+            # Unknown keys are kept as is.
+            return get(key, "#" + key) + end
+
+        return _KEY_PATTERN_.sub(replace, string)
+
 if __name__ == "__main__":
     l = Lang.from_locale("en_US")
     print(l.translate("#test")) # translate key
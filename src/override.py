@@ -5,62 +5,26 @@ Name: override.py
 Description: Function overrides in python
 """
 import functools
-import inspect
 from typing import Any, Callable, Dict, List, Union, Optional
-import sys
-
-# Placeholder for framework
-def _getClassNameFromFunction(func: Callable) -> str:
-    if hasattr(func, "__func__"):
-        return _getClassNameFromFunction(func.__func__)
-    elif hasattr(func, "func"):
-        return _getClassNameFromFunction(func.func)
-
-    if hasattr(func, "__self__"):
-        return func.__self__.__class__.__qualname__
-
-    moduleName = func.__module__
-    module = sys.modules[moduleName]
-    qualname = func.__qualname__
-    name = func.__name__
-    splits = qualname.split(".")
-
-    if len(splits) == 1:
-        # If there is only one split then
-        # the function is in the module scope.
-        return func.__module__ + "." + func.__name__
-
-    obj = module
-    objects = {}
-
-    # Skip the last split (its the function itself)
-    for split in splits[:-1]:
-        if not hasattr(obj, split):
-            continue
-
-        obj = getattr(obj, split)
-        objects[split] = obj
-
-    cls = None
-    for obj in reversed(list(objects.values())):
-        if inspect.isclass(obj) and getattr(obj, name) == func:
-            cls = obj
-            break
-
-    if cls is None:
-        return None
-    else:
-        return cls.__qualname___
+import weakref
 
 def _getManagerId(func: Callable) -> str:
     """
     Returns the manager id of a given function.
+
+    Methods share a manager with the rest of their class and module
+    scope functions share a manager with the rest of their module.
     """
-    cls = _getClassNameFromFunction(func)
-    if cls:
-        return cls
+    # Bound methods / classmethods / staticmethods
+    func = getattr(func, "__func__", func)
+
+    qualname = func.__qualname__
+
+    if "." in qualname:
+        # The qualname of the owner (class or enclosing function)
+        return func.__module__ + "." + qualname.rsplit(".", 1)[0]
     else:
-        return func.__qualname__
+        return func.__module__
 
 def _getHash(types: List[type]) -> int:
     """
@@ -127,19 +91,21 @@ class _OverrideManager:
         return wrapper
 
 class _OverrideManagerFactory:
-    _managers: Dict[str, _OverrideManager] = {}
+    # Managers are only weakly referenced here, the override wrappers
+    # hold the strong references. Once every wrapper of a manager is gone
+    # (e.g. a dynamically created class is collected) the manager is too.
+    _managers: "weakref.WeakValueDictionary[str, _OverrideManager]" = weakref.WeakValueDictionary()
 
     @classmethod
     def getManager(cls, func: Callable) -> _OverrideManager:
         id = _getManagerId(func)
+        manager = cls._managers.get(id, None)
 
-        if id in cls._managers:
-            return cls._managers[id]
-
-        else:
+        if manager is None:
             manager = _OverrideManager(id)
             cls._managers[id] = manager
-            return manager
+
+        return manager
 
 def override(func: Callable) -> Callable:
     """
@@ -6,23 +6,31 @@ Description: A simple profiler.
 """
 import sys
 import time as _time
-from typing import Dict, Optional, TextIO
+from typing import Dict, List, Optional, TextIO
+
+# Bind perf_counter_ns once, start() and end() are meant to measure very
+# short intervals so avoid the module attribute lookup on every call.
+# Times are stored as integer nanoseconds, they are only converted
+# to seconds when dumped.
+_perf = _time.perf_counter_ns
 
 class Profile:
     """
     Represents a single profile.
-    Used Internally by the Profiler.
+    Profiles are created on demand by the Profiler from its data.
     """
-    def __init__(self, name: str, starttime: float):
+    __slots__ = ("name", "starttime", "endtime", "elapsed")
+
+    def __init__(self, name: str, starttime: int, endtime: int=-1, elapsed: int=-1):
         self.name = name
         self.starttime = starttime
 
         # -1 indicates that the end of the profile has
         # not been reached.
-        self.endtime = -1
-        self.elapsed = -1
+        self.endtime = endtime
+        self.elapsed = elapsed
 
-    def end(self, endtime: float) -> None:
+    def end(self, endtime: int) -> None:
         """
         Call this to end the profile with the given endtime.
         Calculates the elapsed time.
@@ -32,75 +40,114 @@ class Profile:
 
 class _Profiler:
     def __init__(self):
-        self._profiles: Dict[str, Profile] = {}
-        self._current_profile: Optional[Profile] = None
-
-    def start(self, name: str) -> None:
+        # Profiles are stored as parallel lists, `_names` maps
+        # a profile name to its index in the lists.
+        self._names: Dict[str, int] = {}
+        self._start: List[int] = []
+        self._end: List[int] = []
+        self._elapsed: List[int] = []
+
+        # Names of the profiles that have been started but not ended yet.
+        # The last item is the innermost profile, this allows nested profiles.
+        self._stack: List[str] = []
+
+    def start(self, name: str, allow_overwrite: Optional[bool]=False) -> None:
         """
         Starts a profile with the given name.
+        If `allow_overwrite` is True then an existing profile
+        with the same name is replaced.
         """
-        time = _time.perf_counter() # Get the time as soon as possible.
-
-        if name in self._profiles:
+        time = _perf() # Get the time as soon as possible.
+
+        names = self._names
+        index = names.get(name, None)
+
+        if index is None:
+            names[name] = len(names)
+            self._start.append(time)
+            self._end.append(-1)
+            self._elapsed.append(-1)
+        elif allow_overwrite:
+            if self._end[index] == -1:
+                # Restarting a running profile, it becomes the innermost one.
+                self._stack.remove(name)
+            self._start[index] = time
+            self._end[index] = -1
+            self._elapsed[index] = -1
+        else:
             raise TypeError(f"profile already exists for {name}")
 
-        p = Profile(name, time)
-        self._profiles[name] = p
-        self._current_profile = name
+        self._stack.append(name)
 
     def end(self, name: Optional[str]=None) -> None:
         """
-        Ends a profile using either the given name, or the last created
-        profile.
+        Ends a profile using either the given name, or the innermost
+        profile that has not been ended yet.
         """
-        time = _time.perf_counter() # Get the time as soon as possible
+        time = _perf() # Get the time as soon as possible
+
+        stack = self._stack
 
         if name is None:
-            if self._current_profile is None:
+            if not stack:
                 raise TypeError("no current profile")
-            name = self._current_profile
+            name = stack.pop()
+
+        elif stack and stack[-1] == name:
+            # Ending the innermost profile (the common case)
+            stack.pop()
 
-        if name not in self._profiles:
+        elif name in stack:
+            stack.remove(name)
+
+        index = self._names.get(name, None)
+
+        if index is None:
             raise KeyError(f"unknown profile {name}")
 
-        p = self._profiles[name]
-        p.end(time)
+        self._end[index] = time
+        self._elapsed[index] = time - self._start[index]
 
-        if name == self._current_profile:
-            self._current_profile = None
+    def _getProfile(self, name: str, index: int) -> Profile:
+        """
+        Creates a Profile for the profile at the given index.
+        """
+        return Profile(name, self._start[index], self._end[index], self._elapsed[index])
 
     def data(self) -> Dict[str, Profile]:
         """
         Get profiler data.
         """
-        return self._profiles
+        return {name: self._getProfile(name, index) for name, index in self._names.items()}
 
     def clear(self) -> None:
         """
         Clears profiler data.
         """
-        self._profiles.clear()
-        self._current_profile = None
+        self._names.clear()
+        self._start.clear()
+        self._end.clear()
+        self._elapsed.clear()
+        self._stack.clear()
 
     def dump(self, stream: Optional[TextIO]=sys.stdout, clear: Optional[bool]=False) -> None:
         """
         Dumps profiler data to the stream and then clears all data if `clear` is True.
         """
+        names = self._names
 
-        # Header
-        print("Name\t\t\tElapsed", file=stream)
-        print("-----------------------", file=stream)
-
-        for name, profile in self._profiles.items():
-            if profile.endtime < 0:
-                raise TypeError(f"profile '{name}' not ended")
-
-            elapsed = round(profile.elapsed, 2)
+        # min() finds any unended profile (-1) in one pass.
+        if names and min(self._end) < 0:
+            name = next(name for name, index in names.items() if self._end[index] < 0)
+            raise TypeError(f"profile '{name}' not ended")
 
-            print(f"{name}\t\t\t{elapsed}", file=stream)
+        # Convert every elapsed time in one pass, the indexes of
+        # `names` are in the same order as the lists.
+        elapsed = [round(ns / 1e9, 2) for ns in self._elapsed]
+        lines = [f"{name}\t\t\t{seconds}" for name, seconds in zip(names, elapsed)]
 
-        # Footer
-        print("-----------------------", file=stream)
+        # Header, profiles, footer
+        print("Name\t\t\tElapsed", "-----------------------", *lines, "-----------------------", sep="\n", file=stream)
 
         # Clear
         if clear:
@@ -110,10 +157,10 @@ class _Profiler:
         """
         Get a profile given it's name.
         """
-        if name not in self._profiles:
+        if name not in self._names:
             raise KeyError(name)
 
-        return self._profiles[name]
+        return self._getProfile(name, self._names[name])
 
 Profiler = _Profiler()
 
@@ -130,5 +177,19 @@ if __name__ == "__main__":
     print()
     
     profile = Profiler.get("test")
-    r = round(profile.elapsed, 2)
-    assert r >= 1.98 and r <= 2.02 # +- 0.2
\ No newline at end of file
+    r = round(profile.elapsed / 1e9, 2)
+    assert r >= 1.98 and r <= 2.02 # +- 0.2
+
+    # Overwriting a running profile must leave it running only once.
+    Profiler.clear()
+    Profiler.start("outer")
+    Profiler.start("outer", allow_overwrite=True)
+    Profiler.end()
+
+    try:
+        Profiler.end()
+        raise AssertionError("overwritten profile was started twice")
+    except TypeError:
+        pass
+
+    assert list(Profiler.data()) == ["outer"] and Profiler.get("outer").elapsed >= 0
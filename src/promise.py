@@ -5,16 +5,25 @@ Name: promise.py
 Description: Promise-like objects in python.
 """
 import asyncio
+import inspect
+
+from enum import IntEnum
 
-from renum import frozenenum
 # Promise States
-PromiseStates = frozenenum(
-    "PENDING",
-    "CANCELLED",
-    "FINISHED",
-)
+class PromiseStates(IntEnum):
+    PENDING = 0
+    CANCELLED = 1
+    FINISHED = 2
+
+# The state values are bound to module level names so that
+# state checks are plain integer comparisons.
+_PENDING = PromiseStates.PENDING.value
+_CANCELLED = PromiseStates.CANCELLED.value
+_FINISHED = PromiseStates.FINISHED.value
 
 class PromiseResult:
+    __slots__ = ("status", "promise", "data")
+
     FAILURE = 0
     SUCCESS = 1
 
@@ -28,9 +37,11 @@ class PromiseResult:
         return f"<PromiseResult({status=})>"
 
 class Promise:
-    def __init__(self, function, *, loop=None):
+    __slots__ = ("_state", "_result", "_exception", "_then", "_parent", "_error", "_resolved_error", "_function", "_blocking")
+
+    def __init__(self, function, *, loop=None, blocking=False):
         # Promise State
-        self._state = PromiseStates.PENDING
+        self._state = _PENDING
 
         # Result value
         self._result = None
@@ -47,11 +58,17 @@ class Promise:
         # Exception handler callback
         self._error = None
 
+        # Closest exception handler from this promise or its parents
+        self._resolved_error = None
+
         # Function callback
         self._function = function
 
+        # Should resolve() run the function in an executor?
+        self._blocking = blocking
+
     def __str__(self):
-        state = PromiseStates[self._state]
+        state = PromiseStates(self._state).name
         return f"<Promise({state=!s})>"
 
     def _get_root(self):
@@ -61,7 +78,7 @@ class Promise:
         return p 
 
     def get_result(self):
-        if self._state == PromiseStates.PENDING:
+        if self._state == _PENDING:
             self._get_result()
 
         if not isinstance(self._result, PromiseResult):
@@ -69,84 +86,99 @@ class Promise:
             self._result = PromiseResult(status, self, self._result)
         return self._result
 
-    def _get_result_async(self):
-        p = self._get_result()
-
-        if p._exception is not None:
-            pass
-
-    def _get_result(self):
+    def _check_resolvable(self):
         if self._parent is not None:
             raise TypeError("Can only call getResult on root promise")
-        elif self._state != PromiseStates.PENDING:
+        elif self._state != _PENDING:
             raise TypeError("cannot get new result of non-pending promise state")
 
+    def _get_chain(self):
+        # Gather the chain first, its length is known
+        # once the end of the chain has been reached.
+        chain = []
         p = self
+        while p is not None:
+            chain.append(p)
+            p = p._then
+        return chain
 
-        if p._then is None:
-            self._result = p._function()
-            return
+    def _get_args(self):
+        parent = self._parent
 
-        i = 0
-        while True:
-            i+=1
-            if i>10000: raise RecursionError("maximum recursion reached in Promise._get_result()")
+        if parent is not None and parent._result is not None:
+            return (parent._result,)
+        else:
+            return tuple()
+
+    async def resolve(self):
+        """
+        Resolves the promise chain on the running event loop and returns the result.
+        Coroutine functions are awaited and blocking functions
+        are run in the loop's default executor.
+        """
+        self._check_resolvable()
+
+        loop = asyncio.get_running_loop()
 
-            if p._parent is not None and p._parent._result is not None:
-                args = (p._parent._result,)
-            else:
-                args = tuple()
+        for p in self._get_chain():
+            function = p._function
+            args = p._get_args()
 
             try:
-                p._result = p._function(*args)
+                if inspect.iscoroutinefunction(function):
+                    p._result = await function(*args)
+                elif p._blocking:
+                    p._result = await loop.run_in_executor(None, function, *args)
+                else:
+                    p._result = function(*args)
                 p.finish()
             except Exception as exc:
                 p._exception = exc
                 p.cancel()
-                return p
-
-            if p._then is None:
                 break
 
-            p = p._then
+        return self.get_result()
+
+    def _get_result(self):
+        self._check_resolvable()
+
+        if self._then is None:
+            self._result = self._function()
+            return
 
+        for p in self._get_chain():
+            args = p._get_args()
+
+            try:
+                p._result = p._function(*args)
+                p.finish()
+            except Exception as exc:
+                p._exception = exc
+                p.cancel()
+                return p
 
         return p
             
     def _get_error_handler(self):
-        # Start at the next promise.
+        # Start at the next promise, its resolved handler is
+        # the closest handler walking up the chain from there.
         if self._then is not None:
-            p = self._then
+            return self._then._resolved_error
         else:
-            p = self
-
-        i=0
-        while True:
-            i+=1
-            if i>10000: raise RecursionError("maximum recursion reached in Promise._get_error_handler()")
-
-            if p._error is not None:
-                break
-
-            if p._parent is None:
-                break
-
-            p = p._parent
-
-        return p._error
+            return self._resolved_error
 
 
     def cancelled(self):
-        return self._state == PromiseStates.CANCELLED
+        return self._state == _CANCELLED
 
     def done(self):
-        return self._state == PromiseStates.FINISHED
+        return self._state == _FINISHED
 
     def finish(self):
-        self._state = PromiseStates.FINISHED
+        self._state = _FINISHED
 
     def cancel(self):
-        self._state = PromiseStates.CANCELLED
+        self._state = _CANCELLED
         
         if self._exception is None:
             raise TypeError("cancelled with no exception")
@@ -163,13 +195,23 @@ class Promise:
             # If there is no handler present then raise the error.
             raise self._exception
 
-    def then(self, func):
-        self._then = Promise(func)
+    def then(self, func, *, blocking=False):
+        self._then = Promise(func, blocking=blocking)
         self._then._parent = self
+        self._then._resolved_error = self._resolved_error
         return self._then
 
     def error(self, func):
         self._error = func
+        self._resolved_error = func
+
+        # Pass the handler down the chain until a promise
+        # with its own handler is reached.
+        p = self._then
+        while p is not None and p._error is None:
+            p._resolved_error = func
+            p = p._then
+
         return self  
 
     def __enter__(self):
@@ -180,6 +222,12 @@ class Promise:
     def __exit__(self, exc_type, exc_val, exc_tb):
         return
 
+    async def __aenter__(self):
+        return await self._get_root().resolve()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return
+
 if __name__ == "__main__":
     def _internalGetJson():
         return {"test": 123}
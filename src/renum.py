@@ -15,15 +15,10 @@ def _enum(structklass: T, *args: Any) -> T:
 
     Takes the struct class to use and the enum arguments.
     """
-    data = {}
-    counter = 0
-
     # Give each arg an integer value and return a struct.
-    for arg in args:
-        data[arg] = counter
-        counter += 1
-
-    return structklass(**data)
+    # The values are unique integers so the struct can be
+    # populated directly.
+    return structklass._bulkInit((arg, i) for i, arg in enumerate(args))
 
 def enum(*args: Any) -> Struct:
     """
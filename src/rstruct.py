@@ -7,7 +7,7 @@ dummy object that can hold any data.
 
 Also contains the FrozenStruct which only allows attribute reading.
 """
-import inspect
+from typing import Any, Iterable, Tuple
 
 class FrozenError(Exception):
     """
@@ -26,22 +26,39 @@ class Struct:
     >>> s.key2 = someValue
     ValueError
     """
+    # The struct data is kept in the instance __dict__ so that keys are
+    # read through normal attribute lookup. The value index is slotted
+    # so that it does not show up as a key.
+    # `_keysByValue` maps every hashable value back to its key,
+    # this is used for fast duplicate checks and value -> key lookups.
+    # `_unhashableValues` holds the values that cannot be in `_keysByValue`.
+    __slots__ = ("__dict__", "_keysByValue", "_unhashableValues")
+
     def __init__(self, **kwargs):
+        object.__setattr__(self, "_keysByValue", {})
+        object.__setattr__(self, "_unhashableValues", [])
+
         for key in kwargs:
             setattr(self, key, kwargs[key])
 
-    def __str__(self):
-        s = f"<{self.__class__.__qualname__}("
-
-        # For empty structs, otherwise
-        # it shows "<Struc)>"
-        if len(self.__dict__) == 0:
-            return s + ")>"
+    @classmethod
+    def _bulkInit(cls, pairs: Iterable[Tuple[str, Any]]) -> "Struct":
+        """
+        Creates a struct from (key, value) pairs without going
+        through __setattr__.
+        NOTE: No duplicate checking is done, the caller must
+        guarantee that all values are unique and hashable.
+        """
+        self = cls.__new__(cls)
+        data = self.__dict__
+        data.update(pairs)
+        object.__setattr__(self, "_keysByValue", {value: key for key, value in data.items()})
+        object.__setattr__(self, "_unhashableValues", [])
+        return self
 
-        for arg in self.__dict__:
-            s += f"{arg}={getattr(self, arg)}, "
-        s = s[:len(s)-2] + ")>"
-        return s
+    def __str__(self):
+        inner = ", ".join(f"{key}={value}" for key, value in self.__dict__.items())
+        return f"<{type(self).__qualname__}({inner})>"
 
     def __repr__(self):
         return str(self.__dict__)
@@ -52,29 +69,80 @@ class Struct:
 
         return other in self.__dict__
 
+    def __getstate__(self):
+        return self.__dict__
+
+    def __setstate__(self, state):
+        # Used by copy and pickle, the value index is rebuilt from the data.
+        object.__setattr__(self, "_keysByValue", {})
+        object.__setattr__(self, "_unhashableValues", [])
+
+        for key in state:
+            setattr(self, key, state[key])
+
     def __getitem__(self, item):
         # Get item returns the key from a given value.
-        vals = list(self.__dict__.values())
-        index = vals.index(item)
-
-        if item not in vals or index < 0:
-            raise ValueError(item)
-        else:
-            keys = list(self.__dict__.keys())
-            return keys[index]
+        try:
+            return self._keysByValue[item]
+        except KeyError:
+            raise ValueError(item) from None
+        except TypeError:
+            # Unhashable values are not in the index.
+            pass
+
+        for key, value in self.__dict__.items():
+            if value == item:
+                return key
+        raise ValueError(item)
 
     def __call__(self, item):
         # Calling returns the value from a given key.
-        if item not in self.__dict__:
+        data = self.__dict__
+        if item not in data:
             raise KeyError(item)
 
-        return self.__dict__[item]
+        return data[item]
 
     def __setattr__(self, attr, value):
-        if value in self.__dict__.values():
+        data = self.__dict__
+        keysByValue = self._keysByValue
+
+        try:
+            duplicate = value in keysByValue
+            hashable = True
+        except TypeError:
+            # Unhashable values are only compared against other unhashable values.
+            duplicate = value in self._unhashableValues
+            hashable = False
+
+        if duplicate:
             raise ValueError(f"Duplicate value '{value}' from key '{attr}'")
 
-        self.__dict__[attr] = value
+        if attr in data:
+            # The old value is being replaced.
+            old = data[attr]
+            try:
+                del keysByValue[old]
+            except TypeError:
+                self._unhashableValues.remove(old)
+
+        data[attr] = value
+
+        if hashable:
+            keysByValue[value] = attr
+        else:
+            self._unhashableValues.append(value)
+
+    def __delattr__(self, attr):
+        data = self.__dict__
+        if attr not in data:
+            return object.__delattr__(self, attr)
+
+        value = data.pop(attr)
+        try:
+            del self._keysByValue[value]
+        except TypeError:
+            self._unhashableValues.remove(value)
 
     def __setitem__(self, item, value):
         return self.__setattr__(item, value)
@@ -83,7 +151,10 @@ class Struct:
         """
         Returns True if `attr` is inside of the struct values.
         """
-        return attr in self.__dict__.values()
+        try:
+            return attr in self._keysByValue
+        except TypeError:
+            return attr in self._unhashableValues
 
     def _freeze(self) -> "FrozenStruct":
         """
@@ -93,17 +164,44 @@ class Struct:
         return freeze(self)
 
 class FrozenStruct(Struct):
-    def __setattr__(self, attr, value):
-        # Check if the previous frame was within the FrozenStruct class or not.
-        # Currently the only way to set attributes of a FrozenStruct
-        # is inside FrozenStruct.__init__ / Struct.__init__
-        _self = inspect.stack()[1][0].f_locals.get("self", None)
+    # `_frozen` is set once the struct has been populated,
+    # after that all attribute setting raises a FrozenError.
+    __slots__ = ("_frozen",)
 
-        if _self and (_self == self or _self == FrozenStruct):
-            self.__dict__[attr] = value
-        else:
+    def __init__(self, **kwargs):
+        self.__setstate__(kwargs)
+
+    def __setstate__(self, state):
+        # NOTE: Frozen structs do not check for duplicate values,
+        # the first key of a value is used for value -> key lookups.
+        keysByValue = {}
+        unhashableValues = []
+        for key, value in state.items():
+            try:
+                keysByValue.setdefault(value, key)
+            except TypeError:
+                unhashableValues.append(value)
+
+        self.__dict__.update(state)
+        object.__setattr__(self, "_keysByValue", keysByValue)
+        object.__setattr__(self, "_unhashableValues", unhashableValues)
+        object.__setattr__(self, "_frozen", True)
+
+    @classmethod
+    def _bulkInit(cls, pairs: Iterable[Tuple[str, Any]]) -> "FrozenStruct":
+        self = super()._bulkInit(pairs)
+        object.__setattr__(self, "_frozen", True)
+        return self
+
+    def __setattr__(self, attr, value):
+        if getattr(self, "_frozen", False):
             raise FrozenError("Struct is frozen and cannot be modified.")
 
+        self.__dict__[attr] = value
+
+    def __delattr__(self, attr):
+        raise FrozenError("Struct is frozen and cannot be modified.")
+
     def __setitem__(self, item, value):
         raise FrozenError("Struct is frozen and cannot be modified.")
 
@@ -111,4 +209,32 @@ def freeze(struct: Struct) -> FrozenStruct:
     """
     Freezes a struct.
     """
-    return FrozenStruct(**struct.__dict__)
\ No newline at end of file
+    return FrozenStruct(**struct.__dict__)
+
+if __name__ == "__main__":
+    import copy
+    import pickle
+
+    s = Struct(a=1, b=[2])
+    for other in (copy.copy(s), copy.deepcopy(s), pickle.loads(pickle.dumps(s))):
+        assert other.__dict__ == s.__dict__
+        assert other[1] == "a" and other[[2]] == "b"
+        other.c = 3
+
+    f = s._freeze()
+    for other in (copy.copy(f), copy.deepcopy(f), pickle.loads(pickle.dumps(f))):
+        assert type(other) is FrozenStruct and other.__dict__ == f.__dict__
+        assert other[1] == "a"
+        try:
+            other.c = 3
+        except FrozenError:
+            pass
+        else:
+            raise AssertionError("FrozenStruct copy is not frozen")
+
+    # Deleting a key frees its value.
+    del s.a
+    assert "a" not in s and not s._hasValue(1)
+    s.d = 1
+
+    print("Struct tests passed")
@@ -4,6 +4,9 @@ Copyright (c) 2022 Rilow, All rights reserved.
 Name: rtest.py
 Description: A simple testing library.
 """
+import functools
+import inspect
+import sys
 from typing import Any, Callable, Type, Iterable, Union, List, Dict, Optional
 
 Number = Union[float, int]
@@ -16,6 +19,17 @@ class RAssertionError(AssertionError):
     """
     pass
 
+def _error(msg: Optional[Union[str, Callable[[], str]]]="") -> RAssertionError:
+    """
+    Returns the RAssertionError to raise for a failed assertion.
+    `msg` can be a callable returning the message, so that the message is only
+    built when an assertion fails e.g. assertEqual(a, b, msg=lambda: f"{a} != {b}")
+    """
+    if callable(msg):
+        msg = msg()
+
+    return RAssertionError(msg or "")
+
 # Internal Assert Functions.
 def _assert(x: Any, msg: Optional[str]="") -> None:
     """
@@ -24,138 +38,154 @@ def _assert(x: Any, msg: Optional[str]="") -> None:
     """
     if x: return
 
-    raise RAssertionError(msg)
+    raise _error(msg)
 
 # Copy of original function. Because
 # all assertion functions call this one internally
 # this allows you to overwrite assertion behaviour
 # by overwriting this function. You can then restore the
 # original (or call the original) by using `__assert__`
+# NOTE: While `_assert` is the original, passing assertions
+# return without calling it.
 __assert__ = _assert
 
-def _assertNoError(func: Callable, msg: Optional[str]="") -> None:
-    """
-    Asserts that function `func` does not raise an exception.
-    Calls _assert(x) where x is True if an exception was raised.
-    """
-    try:
-        func()
-    except:
-        exc = False
-    else:
-        exc = True
-
-    _assert(exc, msg)
-
-def _assertError(func: Callable, type_: Type[Exception], msg: Optional[str]="") -> None:
-    """
-    Asserts that function `func` raises an exception of type `type_`
-    Calls _assert(x) where x is True if an exception of type `type_` was raised.
-    """
-    try:
-        func()
-    except type_:
-        exc = True
-    except Exception:
-        exc = False
-    else:
-        exc = True
-
-    return _assert(exc)
-
 # Public Assert Functions
-def assertTrue(x: Any, msg: Optional[str]="") -> None:
+def assertTrue(x: Any, /, msg: Optional[str]="") -> None:
     """
     Assert that x is True.
     """
-    _assert(x, msg)
+    if x and _assert is __assert__: return
+    return _assert(x, msg)
 
-def assertFalse(x: Any, msg: Optional[str]="") -> None:
+def assertFalse(x: Any, /, msg: Optional[str]="") -> None:
     """
     Assert that x is False.
     """
-    _assert(not x, msg)
+    passed = not x
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
 
-def assertNone(x: Any, msg: Optional[str]="") -> None:
+def assertNone(x: Any, /, msg: Optional[str]="") -> None:
     """
     Assert that x is None
     """
-    _assert(x is None, msg)
+    passed = x is None
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
 
-def assertNotNone(x: Any, msg: Optional[str]="") -> None:
+def assertNotNone(x: Any, /, msg: Optional[str]="") -> None:
     """
     Assert that x is not None
     """
-    _assert(x is not None, msg)
+    passed = x is not None
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
 
-def assertContains(item: Any, x: Iterable, msg: Optional[str]="") -> None:
+def assertContains(item: Any, x: Iterable, /, msg: Optional[str]="") -> None:
     """
     Assert that `x` contains `item`
     """
-    assertIterable(x, msg)
-    _assert(item in x, msg)
+    # `in` raises TypeError for containers which can not be checked,
+    # so there is no need to check that x is iterable first.
+    try:
+        contains = item in x
+    except TypeError:
+        contains = False
 
-def assertDoesNotContain(item: Any, x: Iterable, msg: Optional[str]="") -> None:
+    if contains and _assert is __assert__: return
+    return _assert(contains, msg)
+
+def assertDoesNotContain(item: Any, x: Iterable, /, msg: Optional[str]="") -> None:
     """
     Assert that `x` does not contain `item`
     """
-    assertIterable(x, msg)
-    _assert(item not in x, msg)
+    try:
+        doesNotContain = item not in x
+    except TypeError:
+        doesNotContain = False
 
-def assertIs(x: Any, y: Any, msg: Optional[str]="") -> None:
+    if doesNotContain and _assert is __assert__: return
+    return _assert(doesNotContain, msg)
+
+def assertIs(x: Any, y: Any, /, msg: Optional[str]="") -> None:
     """
     Assert x is y
     """
-    _assert(x is y, msg)
+    passed = x is y
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
 
-def assertIsNot(x: Any, y: Any, msg: Optional[str]="") -> None:
+def assertIsNot(x: Any, y: Any, /, msg: Optional[str]="") -> None:
     """
     Assert x is not y
     """
-    _assert(x is not y, msg)
+    passed = x is not y
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
 
-def assertEqual(x: Any, y: Any, msg: Optional[str]="") -> None:
+def assertEqual(x: Any, y: Any, /, msg: Optional[str]="") -> None:
     """
     Assert x == y
     """
-    _assert(x == y, msg)
+    passed = x == y
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
 
-def assertNotEqual(x: Any, y: Any, msg: Optional[str]="") -> None:
+def assertNotEqual(x: Any, y: Any, /, msg: Optional[str]="") -> None:
     """
     Assert x != y
     """
-    _assert(x != y, msg)
+    passed = x != y
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
 
-def assertIterable(x: Any, msg: Optional[str]="") -> None:
+def assertIterable(x: Any, /, msg: Optional[str]="") -> None:
     """
     Assert that x is iterable.
     """
-    _assertNoError(lambda: iter(x), msg)
+    try:
+        iter(x)
+    except Exception:
+        iterable = False
+    else:
+        iterable = True
 
-def assertNotNaN(x: Any, msg: Optional[str]="") -> None:
+    if iterable and _assert is __assert__: return
+    return _assert(iterable, msg)
+
+def assertNotNaN(x: Any, /, msg: Optional[str]="") -> None:
     """
     Assert x is not NaN (not a number).
     """
     # float("NaN") == float("NaN") => False
-    _assert(x == x)
+    passed = x == x
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
 
-def assertIsInstance(x: Any, y: Type, msg: Optional[str]="") -> None:
+def assertIsInstance(x: Any, y: Type, /, msg: Optional[str]="") -> None:
     """
     Assert x is an instance of y
     """
-    _assert(isinstance(x, y))
+    # Direct instances skip isinstance(), tuples of types never match here.
+    passed = type(x) is y or isinstance(x, y)
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
 
-def assertInRange(n: Number, x: Number, y: Number, msg: Optional[str]="") -> None:
+def assertInRange(n: Number, x: Number, y: Number, /, msg: Optional[str]="") -> None:
     """
     Assert that x < n < y
     """
-    _assert((x < y) and (n > x and n < y), msg)
+    passed = (x < y) and (n > x and n < y)
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
 
-def assertNotInRange(n: Number, x: Number, y: Number, msg: Optional[str]="") -> None:
+def assertNotInRange(n: Number, x: Number, y: Number, /, msg: Optional[str]="") -> None:
     """
     Assert that n < x || n > y
     """
-    _assert((x < y) and (n < x or n > y), msg)
+    passed = (x < y) and (n < x or n > y)
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
 
 def _getArgs(args: List[Any], funcName: str) -> List[Any]:
     """
@@ -164,108 +194,238 @@ def _getArgs(args: List[Any], funcName: str) -> List[Any]:
     e.g.
     someFunction([1, 2, 3, 4]) == someFunction(1, 2, 3, 4)
     If someFunction uses _getArgs.
-    """
-    if len(args) == 0:
+    NumPy arrays are returned as well, see _all() and _any()
+    """
+    if len(args) == 1:
+        t = type(args[0])
+        # Exact types are checked first, subclasses (eg. namedtuples) are nested lists as well.
+        if t is list or t is tuple or t.__name__ == "ndarray" or isinstance(args[0], (list, tuple)):
+            return args[0]
+    elif len(args) == 0:
         raise TypeError(f"must call {funcName} with at least one argument")
-    elif len(args) == 1 and isinstance(args[0], (list, tuple)):
-        args = args[0]
     return args
 
+def _all(args: Iterable) -> bool:
+    """
+    Same as all(args) but uses the vectorized all() of NumPy arrays.
+    NOTE: NumPy is not imported, arrays are detected by their type name.
+    """
+    if type(args).__name__ == "ndarray":
+        return bool(args.all())
+    return all(args)
+
+def _any(args: Iterable) -> bool:
+    """
+    Same as any(args) but uses the vectorized any() of NumPy arrays.
+    """
+    if type(args).__name__ == "ndarray":
+        return bool(args.any())
+    return any(args)
+
 def assertAll(*args: Any, msg: Optional[str]="") -> None:
     """
     Assert all(*args)
     """
-    args = _getArgs(args, "assertAll")
-    _assert(all(args), msg)
+    x = _all(_getArgs(args, "assertAll"))
+    if x and _assert is __assert__: return
+    return _assert(x, msg)
 
 def assertNotAll(*args: Any, msg: Optional[str]="") -> None:
     """
     Assert all(not arg for arg in *args)
     """
-    args = _getArgs(args, "assertNotAll")
-    _assert(all([not x for x in args]), msg)
+    x = not _any(_getArgs(args, "assertNotAll"))
+    if x and _assert is __assert__: return
+    return _assert(x, msg)
 
 def assertAny(*args: Any, msg: Optional[str]="") -> None:
     """
     Assert any(*args)
     """
-    args = _getArgs(args, "assertAny")
-    _assert(any(args), msg)
+    x = _any(_getArgs(args, "assertAny"))
+    if x and _assert is __assert__: return
+    return _assert(x, msg)
 
-def assertRaises(func: Callable, exc: Type[Exception], *args: Any, msg: Optional[str]="", **kwargs: Any) -> None:
+def assertRaises(func: Callable, exc: Type[Exception], /, *args: Any, msg: Optional[str]="", **kwargs: Any) -> None:
     """
     Assert that function `func` raises exception(s) `exc`
     """
-    _assertError(lambda: func(*args, **kwargs), exc, msg)
+    try:
+        func(*args, **kwargs)
+    except exc:
+        raised = True
+    except Exception:
+        raised = False
+    else:
+        raised = False
+
+    if raised and _assert is __assert__: return
+    return _assert(raised, msg)
 
-def assertDoesNotRaise(func: Callable, *args: Any, msg: Optional[str]="", **kwargs: Any) -> None:
+def assertDoesNotRaise(func: Callable, /, *args: Any, msg: Optional[str]="", **kwargs: Any) -> None:
     """
     Assert that function `func` does not raise exception(s)
     """
-    _assertNoError(lambda: func(*args, **kwargs), msg)
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        raised = True
+    else:
+        raised = False
+
+    passed = not raised
+    if passed and _assert is __assert__: return
+    return _assert(passed, msg)
+
+# Memoized Assert Functions
+
+# Maximum number of memoized passing checks.
+MEMO_SIZE = 4096
+
+# Passing checks of memoized assertions keyed on the assertion and the ids of its
+# arguments. The arguments are stored so that their ids can not be reused.
+_memo: Dict[tuple, tuple] = {}
+
+def memoizedAssert(func: Callable) -> Callable:
+    """
+    Returns a version of the assertion `func` which skips the check if it
+    has already passed with the same (identical) arguments.
+    NOTE: Only use this when the arguments are not modified between checks,
+    memoized checks are cleared every time a TestSuite is run.
+    """
+    funcid = id(func)
+
+    @functools.wraps(func)
+    def memoized(*args: Any, **kwargs: Any) -> None:
+        if _assert is not __assert__:
+            return func(*args, **kwargs)
+
+        key = (funcid, *map(id, args))
+        if key in _memo:
+            return
+
+        func(*args, **kwargs)
+
+        if len(_memo) >= MEMO_SIZE:
+            _memo.clear()
+        _memo[key] = args
+
+    return memoized
+
+assertIsInstanceMemo = memoizedAssert(assertIsInstance)
+assertEqualMemo = memoizedAssert(assertEqual)
+assertContainsMemo = memoizedAssert(assertContains)
+
+def specialize(assertion: Callable, *fixed: Any, **kwargs: Any) -> Callable:
+    """
+    Returns `assertion` with its first arguments (and any keyword
+    arguments eg. msg) fixed, for asserts that are repeated many times.
+    e.g.
+    >>> assertIsTwo = specialize(assertEqual, 2)
+    >>> assertIsTwo(1 + 1)
+    """
+    return functools.partial(assertion, *fixed, **kwargs)
 
 class TestResult:
     """
     A class that holds the result of a single test.
     """
+    __slots__ = ("test", "name", "function", "passed")
+
     def __init__(self, test_: "test", passed: bool):
         self.test = test_
         self.name = test_.name
         self.function = test_.function
         self.passed = passed
 
+class _ModuleFunction:
+    """
+    Returns the current value of a module global, so that
+    replacing e.g. rtest.assertEqual also affects test suites.
+    """
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: Optional[type]=None) -> Any:
+        return _globals[self.name]
+
+_globals = globals()
+
 class _TestSuiteMeta(type):
     def __new__(cls, name, bases, attrs):
         # Ignore meta-ing TestSuite class.
         if "TestSuite" not in globals():
+            # Put the assertion functions on the TestSuite class so that
+            # self.assertX is found without going through __getattr__.
+            for gname in globals():
+                if gname.startswith("assert"):
+                    attrs.setdefault(gname, _ModuleFunction(gname))
+
             return type.__new__(cls, name, bases, attrs)
 
         tests = {}
-        _startup = None
-        _startupAll = None
-        _teardown = None
-        _teardownAll = None
+        callers = dict.fromkeys(("_startup", "_startupAll", "_teardown", "_teardownAll"))
 
         for attr, value in attrs.items():
-            if isinstance(value, test):
+            bucket = _DECORATOR_BUCKETS.get(type(value), None)
+
+            if bucket is None:
+                if not isinstance(value, _BaseFunctionCaller):
+                    continue
+
+                # Subclass of a decorator, use its closest decorator base.
+                decorators = [klass for klass in type(value).__mro__ if klass in _DECORATOR_BUCKETS]
+                if not decorators:
+                    continue
+                bucket = _DECORATOR_BUCKETS[decorators[0]]
+
+            if bucket == "_tests":
                 tests[attr] = value
-            elif isinstance(value, startup):
-                _startup = value
-            elif isinstance(value, startupAll):
-                _startupAll = value
-            elif isinstance(value, teardown):
-                _teardown = value
-            elif isinstance(value, teardownAll):
-                _teardownAll = value
+            else:
+                callers[bucket] = value
 
         attrs["_tests"] = tests
-        attrs["_startup"] = _startup
-        attrs["_startupAll"] = _startupAll
-        attrs["_teardown"] = _teardown
-        attrs["_teardownAll"] = _teardownAll
+        attrs["_tests_tuple"] = tuple(tests.values())
+        attrs.update(callers)
 
         return type.__new__(cls, name, bases, attrs)
 
 class TestSuite(metaclass=_TestSuiteMeta):
+    # If streaming is True each result is printed as soon as its test has run
+    # rather than keeping every result until the end.
+    streaming: bool = False
+
+    # Is the current run printing results?
+    _printing: bool = False
+
     def __getattr__(self, attr):
         # Check globals (for assertion methods)
-        if attr in globals():
-            return globals()[attr]
+        try:
+            return _globals[attr]
+        except KeyError:
+            pass
         raise AttributeError(f"TestSuite has no attribute {attr}")
 
-    def _printresults(self) -> None:
-
-        print("============================")
+    # Result table
+    _HEADER = "============================\n" + "{:<20s}{:<7s}\n\n".format("NAME", "PASSED?")
+    _FOOTER = "============================\n"
 
-        print("{:<20s}{:<7s}".format("NAME", "PASSED?"), "\n", sep="")
+    def _formatresult(self, name: str, passed: bool) -> str:
+        n = name + ":"
+        return f"{n:<20s}{str(bool(passed)):<5s}\n"
 
-        for testresult in self._results:
-            n = testresult.name + ":"
-            print(f"{n:<20s}{str(testresult.passed):<5s}")
+    def _printresults(self) -> None:
+        lines = [self._HEADER]
+        lines.extend(map(self._formatresult, self._result_names, self._result_passed))
+        lines.append(self._FOOTER)
 
-        self._results.clear()
+        # Write everything at once rather than a print per result.
+        sys.stdout.write("".join(lines))
 
-        print("============================")
+        self._result_names.clear()
+        self._result_passed.clear()
 
     @classmethod
     def run(cls, printresults: Optional[bool]=True) -> None:
@@ -273,6 +433,18 @@ class TestSuite(metaclass=_TestSuiteMeta):
         Start running this test suites tests.
         """
         self = cls()
+        self._printing = printresults
+
+        if cls.streaming:
+            if printresults:
+                sys.stdout.write(self._HEADER)
+
+            self._doTests()
+
+            if printresults:
+                sys.stdout.write(self._FOOTER)
+            return
+
         self._doTests()
 
         if printresults:
@@ -283,29 +455,38 @@ class TestSuite(metaclass=_TestSuiteMeta):
         Runs tests.
         """
         # Initialize suite.
-        self._results: List[TestResult] = []
+        # Results are stored as parallel arrays (test name, passed)
+        # rather than a TestResult per test.
+        self._result_names: List[str] = []
+        self._result_passed = bytearray()
+        _memo.clear()
 
         # startupAll
         if self._startupAll is not None:
             self._startupAll(self)
 
+        startup = self._startup
+        teardown = self._teardown
+
         # Run each test,
-        for test_ in self._tests.values():
+        for test_ in self._tests_tuple:
+            if startup is not None:
+                startup(self)
+
             self._runTest(test_)
 
+            if teardown is not None:
+                teardown(self)
+
         if self._teardownAll is not None:
             self._teardownAll(self)
 
     def _runTest(self, test_: "test") -> None:
         """
         Run a test.
+        NOTE: The metaclass only collects instances of test,
+        startup and teardown are called by _doTests().
         """
-        if self._startup is not None:
-            self._startup(self)
-
-        if not isinstance(test_, test):
-            raise TypeError("`test` must be an instance of test")
-
         try:
             test_.__call__(self)
         except RAssertionError: #, AssertionError: # Py_AssertionError
@@ -313,68 +494,92 @@ class TestSuite(metaclass=_TestSuiteMeta):
         else:
             passed = True
 
-        self._results.append(TestResult(test_, passed))
-
-        if self._teardown is not None:
-            self._teardown(self)
+        if self.streaming:
+            if self._printing:
+                sys.stdout.write(self._formatresult(test_.name, passed))
+        else:
+            self._result_names.append(test_.name)
+            self._result_passed.append(passed)
 
-_MISSING_SELF = "missing 1 required positional argument: 'self'"
 _MISSING_SELF_MODULE_TEST_SUITE = TestSuite()
 
+def _takesSelf(function: Callable) -> bool:
+    """
+    Returns True if the first parameter of `function` is `self`.
+    """
+    try:
+        parameters = inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+
+    for parameter in parameters.values():
+        return parameter.name == "self" and parameter.kind in (
+            parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+    return False
+
 class _BaseFunctionCaller:
+    __slots__ = ("function", "name", "_needs_suite")
+
     def __init__(self, function: Callable):
         self.function = function
         self.name = function.__name__
 
-    def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        try:
-            return self.function.__call__(*args, **kwargs)
-        except TypeError as exc:
-            if _MISSING_SELF not in exc.args[0]:
-                raise
-            
-            # Have to catch RAssertionError manually for module level tests,
-            # and then return a result.
-            passed = True
-            try:
-                self.function.__call__(_MISSING_SELF_MODULE_TEST_SUITE, *args, **kwargs)
-            except RAssertionError:
-                passed = False
-
-            return TestResult(self, passed)
+        # Module level tests are still written with a `self` parameter,
+        # when they are called without one a suite is passed in for them.
+        self._needs_suite = _takesSelf(function)
 
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if not self._needs_suite or args or "self" in kwargs:
+            return self.function(*args, **kwargs)
 
+        # Have to catch RAssertionError manually for module level tests,
+        # and then return a result.
+        passed = True
+        try:
+            self.function(_MISSING_SELF_MODULE_TEST_SUITE, **kwargs)
+        except RAssertionError:
+            passed = False
 
+        return TestResult(self, passed)
 
 class test(_BaseFunctionCaller):
     """
     Represents a single test in a suite.
     """
-    pass
+    __slots__ = ()
 
 class startup(_BaseFunctionCaller):
     """
     Represents a test suite startup.
     """
-    pass
+    __slots__ = ()
 
 class startupAll(_BaseFunctionCaller):
     """
     Represents a test suite startup all.
     """
-    pass
+    __slots__ = ()
 
 class teardown(_BaseFunctionCaller):
     """
     Represents a test suite teardown.
     """
-    pass
+    __slots__ = ()
 
 class teardownAll(_BaseFunctionCaller):
     """
     Represents a test suite teardown all
     """
-    pass
+    __slots__ = ()
+
+# Decorator type -> the TestSuite attribute it is collected into.
+_DECORATOR_BUCKETS: Dict[Type[_BaseFunctionCaller], str] = {
+    test: "_tests",
+    startup: "_startup",
+    startupAll: "_startupAll",
+    teardown: "_teardown",
+    teardownAll: "_teardownAll",
+}
 
 def _test() -> None:
     """
@@ -385,14 +590,16 @@ def _test() -> None:
 
     # assertRaises
     def func(): raise TypeError()
+    def func2(): pass
     assertRaises(func, TypeError)
-    try:
-        assertRaises(func, ValueError)
-    except RAssertionError:
-        pass
-    else:
-        raise RAssertionError()
-    del func
+    for args in ((func, ValueError), (func2, TypeError)):
+        try:
+            assertRaises(*args)
+        except RAssertionError:
+            pass
+        else:
+            raise RAssertionError()
+    del func, func2
 
     # assertDoesNotRaise
     def func(): raise TypeError()
@@ -448,6 +655,9 @@ def _test() -> None:
     # assertEqual
     assertEqual(2, 2)
     assertRaises(assertEqual, RAssertionError, 1, 2)
+    nan = float("NaN")
+    assertRaises(assertEqual, RAssertionError, nan, nan)
+    del nan
 
     # assertNotEqual
     assertNotEqual(1, 2)
@@ -468,6 +678,7 @@ def _test() -> None:
     list2 = [False, False, False]
     assertAll(list1)
     assertRaises(assertAll, RAssertionError, list2)
+    assertRaises(assertAll, RAssertionError, type("MyList", (list,), {})(list2))
     del list1, list2
 
     # assertNotAll
@@ -502,6 +713,20 @@ def _test() -> None:
     assertNotInRange(10, 0, 5)
     assertRaises(assertNotInRange, RAssertionError, 2, 0, 5)
 
+    # memoizedAssert
+    list_ = [1, 2, 3, 4]
+    assertContainsMemo(1, list_)
+    assertContainsMemo(1, list_)
+    assertRaises(assertContainsMemo, RAssertionError, 5, list_)
+    assertEqualMemo(list_, list_)
+    del list_
+
+    # specialize
+    assertIsTwo = specialize(assertEqual, 2, msg="not two")
+    assertIsTwo(1 + 1)
+    assertRaises(assertIsTwo, RAssertionError, 3)
+    del assertIsTwo
+
     # Test TestSuite.
     # NOTE: Assertion methods (i.e. above can be called off the class itself)
     # i.e. the TestSuite class will lookup unknown attributes in the global
@@ -535,6 +760,16 @@ def _test() -> None:
 
     MyTests.run()
 
+    # Streamed results are printed as each test finishes.
+    class MyStreamedTests(TestSuite):
+        streaming = True
+
+        @test
+        def myTest(self):
+            self.assertTrue(True)
+
+    MyStreamedTests.run()
+
     # Tests can also be run without a suite.
     @test
     def mytest(self):
@@ -545,14 +780,39 @@ def _test() -> None:
         self.assertTrue(False)
 
     result = mytest()
-    assertRaises(myTestThatRaises, RAssertionError)
+    assertTrue(result.passed)
+    assertFalse(myTestThatRaises().passed)
     # print(result.function, result.name, result.passed)
 
+    # Suites look the assertions up when they are used, so replacing
+    # one in the module also affects existing suites.
+    calls = []
+    original = assertTrue
+    _globals["assertTrue"] = lambda x, msg="": calls.append(x)
+    try:
+        MyStreamedTests.run(printresults=False)
+    finally:
+        _globals["assertTrue"] = original
+    assertEqual(calls, [True])
+
+    # Subclasses of the decorators are collected like the decorators.
+    class mytest(test):
+        pass
+
+    class MySubclassedTests(TestSuite):
+        @mytest
+        def myTest(self):
+            self.assertTrue(True)
+
+    assertEqual(list(MySubclassedTests._tests), ["myTest"])
+
 __all__ = [
     "TestSuite",
     "startup", "startupAll",
     "teardown", "teardownAll",
     "test",
+    "memoizedAssert",
+    "specialize",
 ]
 
 # Copy assertion methods.
@@ -4,9 +4,11 @@ Copyright (c) 2022 Rilow, All rights reserved.
 Name: rilowtypes.py
 Description: Helpful classes/functions for types.
 """
+import functools
 import operator
 import math
 import sys
+from types import MappingProxyType
 from typing import Dict, Set, Callable, Optional, Type, Tuple, Any, T
 
 COMPARISONS: Dict[str, str] = {
@@ -39,19 +41,17 @@ OPERATIONS: Dict[str, str] = {
     "__divmod__": "divmod()",
 }
 
+# All operation operators can be made into right and augmented operators
+
 # Right Operation Operators (__radd__)
-RIGHT_OPERATIONS: Dict[str, str] = {}
+RIGHT_OPERATIONS: Dict[str, str] = MappingProxyType({
+    "__r" + method[2:]: operand for method, operand in OPERATIONS.items()
+})
 
 # Augmented Operation Operators (__iadd__)
-AUGMENTED_OPERATIONS: Dict[str, str] = {}
-
-# All operation operators can be made into right and augmented operators
-for method, operand in OPERATIONS.items():
-    augment = "__i" + method[2:]
-    augmentoperand = operand + "="
-    right = "__r" + method[2:]
-    RIGHT_OPERATIONS[right] = operand
-    AUGMENTED_OPERATIONS[augment] = augmentoperand
+AUGMENTED_OPERATIONS: Dict[str, str] = MappingProxyType({
+    "__i" + method[2:]: operand + "=" for method, operand in OPERATIONS.items()
+})
 
 UNARY_OPERATIONS: Dict[str, str] = {
     "__pos__": "+", # +x
@@ -108,6 +108,7 @@ ATTRIBUTE_METHODS: Set[str] = {
     "__delete__" # del x
 }
 
+# The functions the magic method wrappers call on the value when a method isn't defined.
 MAGIC_METHOD_TO_FUNCTION: Set[Callable] = {
     "__getattr__": getattr,
     "__setattr__": setattr,
@@ -133,12 +134,13 @@ MAGIC_METHOD_TO_FUNCTION: Set[Callable] = {
     "__repr__": repr,
     "__reversed__": reversed,
 
-    # These require lambdas because they are not simple function calls like func(x)
-    "__call__": lambda x, *args, **kwargs: x.value.__call__(*args, **kwargs),
-    "__getitem__": lambda x, item: x.value.__getitem__(item),
-    "__setitem__": lambda x, item, value: x.value.__setitem__(item, value),
-    "__delitem__": lambda x, item: x.value.__delitem__(item),
-    "__iter__": lambda x: tuple(y for y in x.value.__iter__())
+    "__getitem__": operator.getitem,
+    "__setitem__": operator.setitem,
+    "__delitem__": operator.delitem,
+    "__iter__": iter,
+
+    # This requires a lambda because it is not a simple function call like func(x)
+    "__call__": lambda x, *args, **kwargs: x(*args, **kwargs),
 }
 
 TYPEWRAPPER_IGNORED_ATTRIBUTES: Set[str] = {
@@ -153,14 +155,14 @@ TYPEWRAPPER_IGNORED_ATTRIBUTES: Set[str] = {
     "__repr__",
 }
 
-# Clean namespace
-del method, operand, augment, augmentoperand, right
-
 # Merge collections
-OPERATIONS.update(COMPARISONS)
-OPERATIONS.update(RIGHT_OPERATIONS)
-OPERATIONS.update(AUGMENTED_OPERATIONS)
-OPERATIONS.update(UNARY_OPERATIONS)
+OPERATIONS = MappingProxyType({
+    **OPERATIONS,
+    **COMPARISONS,
+    **RIGHT_OPERATIONS,
+    **AUGMENTED_OPERATIONS,
+    **UNARY_OPERATIONS,
+})
 
 MAGIC_METHODS = MAGIC_METHODS.union(TYPE_CONVERSION_METHODS)
 MAGIC_METHODS = MAGIC_METHODS.union(ATTRIBUTE_METHODS)
@@ -176,41 +178,102 @@ WRAPPED_METHODS = set()
 # ALL_OPERATIONS can be used on TypeWrapper.ALLOWED_OPERATIONS to signify that all operations are allowed.
 ALL_OPERATIONS = MAGIC_NAMES.difference(TYPEWRAPPER_IGNORED_ATTRIBUTES)
 
+# The tables are never modified after this point.
+COMPARISONS = MappingProxyType(COMPARISONS)
+UNARY_OPERATIONS = MappingProxyType(UNARY_OPERATIONS)
+MAGIC_METHOD_TO_FUNCTION = MappingProxyType(MAGIC_METHOD_TO_FUNCTION)
+MAGIC_METHODS = frozenset(MAGIC_METHODS)
+TYPE_CONVERSION_METHODS = frozenset(TYPE_CONVERSION_METHODS)
+ATTRIBUTE_METHODS = frozenset(ATTRIBUTE_METHODS)
+TYPEWRAPPER_IGNORED_ATTRIBUTES = frozenset(TYPEWRAPPER_IGNORED_ATTRIBUTES)
+MAGIC_NAMES = frozenset(MAGIC_NAMES)
+WRAPPED_OPERATIONS = frozenset(WRAPPED_OPERATIONS)
+WRAPPED_METHODS = frozenset(WRAPPED_METHODS)
+ALL_OPERATIONS = frozenset(ALL_OPERATIONS)
+
+class _CopyMode:
+    """
+    The type of the COPY_OPERATIONS sentinels, they are compared by identity.
+    """
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
 # COPY_OPERATIONS_ONCE can be used and will copy all operations present in the value onto the classes
 # ALLOWED_OPERATIONS.
-COPY_OPERATIONS_ONCE = 0
+COPY_OPERATIONS_ONCE = _CopyMode("COPY_OPERATIONS_ONCE")
 
 # COPY_OPERATIONS can be used to copy operations present in the value onto the instance, thus the copy
 # is done for every instance rather than once for the class in COPY_OPERATIONS_ONCE
-COPY_OPERATIONS = 1
+COPY_OPERATIONS = _CopyMode("COPY_OPERATIONS")
+
+class _UnsetOperations:
+    """
+    The allowed operations of a COPY mode instance before TypeWrapper.__init__
+    has copied them. Nothing is allowed, so the wrappers end up in the
+    restricted handlers which raise an error about the missing __init__ call.
+    """
+    __slots__ = ()
+
+    def __contains__(self, attr: str) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "<unset operations>"
+
+_UNSET_OPERATIONS = _UnsetOperations()
+
+def _uninitializedError(self: "TypeWrapper") -> TypeError:
+    """
+    Returns the error for a COPY mode instance that skipped TypeWrapper.__init__
+    """
+    qualname = self.__class__.__qualname__
+    return TypeError(f"'{qualname}' object is not initialized, subclasses using a COPY mode must call TypeWrapper.__init__")
+
+# Returned by getattr() in TypeWrapper.__getattr__ when the value has no such attribute.
+_MISSING = object()
+
+# Operand -> function performing the operation.
+_BINOP: Dict[str, Callable[[Any, Any], Any]] = MappingProxyType({
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "**": operator.pow,
+    "/": operator.truediv,
+    "//": operator.floordiv,
+    "%": operator.mod,
+    "@": operator.matmul,
+    "<<": operator.lshift,
+    ">>": operator.rshift,
+    "&": operator.and_,
+    "^": operator.xor,
+    "|": operator.or_,
+    "divmod()": divmod,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+})
+
+_UNOP: Dict[str, Callable[[Any], Any]] = MappingProxyType({
+    "+": operator.pos,
+    "-": operator.neg,
+    "~": operator.invert,
+})
 
 def doOperation(op: str, x: Any, y: Optional[Any]=None) -> Any:
-    if y is None:
-        if op == "+": return +x
-        elif op == "-": return -x
-        elif op == "~": return ~x
-        else: raise TypeError(f"unknown operation {op}")
-
-    if op == "+": return x + y
-    elif op == "-": return x - y
-    elif op == "*": return x * y
-    elif op == "**": return x ** y
-    elif op == "/": return x / y
-    elif op == "//": return x // y
-    elif op == "%": return x % y
-    elif op == "@": return x @ y
-    elif op == "<<": return x << y
-    elif op == ">>": return x >> y
-    elif op == "&": return x & y
-    elif op == "^": return x ^ y
-    elif op == "|": return x | y
-    elif op == "<": return x < y
-    elif op == ">": return x > y
-    elif op == "<=": return x <= y
-    elif op == ">=": return x >= y
-    elif op == "==": return x == y
-    elif op == "!=": return x != y
-    else: raise TypeError(f"unknown operation {op}")
+    func = _UNOP.get(op, None) if y is None else _BINOP.get(op, None)
+
+    if func is None:
+        raise TypeError(f"unknown operation {op}")
+
+    return func(x) if y is None else func(x, y)
 
 class _TypeWrapperMeta(type):
     """
@@ -218,24 +281,52 @@ class _TypeWrapperMeta(type):
     Used internally by TypeWrapper. And should only be used by TypeWrapper.
     """
     @classmethod
-    def _getAllowedOperations(cls, self):
+    def _resolveAllowedOperations(cls, allowed) -> frozenset:
+        """
+        Returns the set of magic names allowed by `allowed`, which can contain
+        magic names, operands (eg. "+") and builtin functions (eg. len).
+        The wrappers can then check if they are allowed with a single lookup.
+        """
+        allowed = frozenset(allowed)
+        resolved = set(allowed)
+
+        for attr, operation in OPERATIONS.items():
+            if operation in allowed:
+                resolved.add(attr)
+
+        # Magic methods without a builtin function are only restricted
+        # when they are not defined.
+        for attr in MAGIC_METHODS:
+            builtinFunc = MAGIC_METHOD_TO_FUNCTION.get(attr, None)
+            if builtinFunc is None or builtinFunc in allowed:
+                resolved.add(attr)
+
+        return frozenset(resolved)
+
+    @classmethod
+    def _getAllowedOperations(cls, self) -> frozenset:
+        """
+        Copies the allowed operations from the value for the COPY modes.
+        Returns the resolved allowed operations of `self`.
+        """
         klass = self.__class__
-        if klass.ALLOWED_OPERATIONS != COPY_OPERATIONS and klass.ALLOWED_OPERATIONS != COPY_OPERATIONS_ONCE:
-            return
+        if klass.ALLOWED_OPERATIONS is not COPY_OPERATIONS and klass.ALLOWED_OPERATIONS is not COPY_OPERATIONS_ONCE:
+            return self._allowed_operations
 
         valuetype = self.value.__class__
 
         # Replace the instances or the classes ALLOWED_OPERATIONS depending on the mode.
-        if klass.ALLOWED_OPERATIONS == COPY_OPERATIONS:
+        if klass.ALLOWED_OPERATIONS is COPY_OPERATIONS:
             obj = self
         else: # COPY_OPERATIONS_ONCE
             obj = klass
 
-        obj.ALLOWED_OPERATIONS = []
-
-        for attr in dir(valuetype):
-            if attr in MAGIC_NAMES and attr not in TYPEWRAPPER_IGNORED_ATTRIBUTES:
-                obj.ALLOWED_OPERATIONS.append(attr)
+        obj.ALLOWED_OPERATIONS = frozenset(
+            attr for attr in dir(valuetype)
+            if attr in MAGIC_NAMES and attr not in TYPEWRAPPER_IGNORED_ATTRIBUTES
+        )
+        obj._allowed_operations = cls._resolveAllowedOperations(obj.ALLOWED_OPERATIONS)
+        return obj._allowed_operations
 
     @classmethod
     def _getOperationWrapper(cls, attr: str, func: Optional[Callable], _default: bool=False) -> Callable:
@@ -243,50 +334,99 @@ class _TypeWrapperMeta(type):
         Returns an operation wrapper function for a class subclassing TypeWrapper as defined in OPERATIONS.
         Used internally. Do not call.
         """
-        def operationwrapper(self, other: Optional[Any]=None) -> Any:
-            """
-            Internal operation wrapper.
-            """
-            if self.ALLOWED_OPERATIONS == COPY_OPERATIONS or self.ALLOWED_OPERATIONS == COPY_OPERATIONS_ONCE:
-                cls._getAllowedOperations(self)
-
-            operation = OPERATIONS.get(attr, None)
-
-            # If other is None then a unary operation was attempted.
-            args = tuple() if not other else (other,)
-
-            if attr not in self.ALLOWED_OPERATIONS and (operation and operation not in self.ALLOWED_OPERATIONS):
-                right = attr in RIGHT_OPERATIONS
-                return self._handle_restricted_operation(OPERATIONS[attr], *args)
-
-            if isinstance(other, TypeWrapper):
-                othervalue = other.value
-            else:
-                othervalue = other
-
-
-            # Check if the function is defined.
-            if func is None:
-                if hasattr(operator, attr):
-                    result = getattr(operator, attr).__call__(self.value, othervalue)
-                else:
-                    operand = OPERATIONS[attr]
-                    if attr in RIGHT_OPERATIONS:
-                        result = doOperation(operand, othervalue, self.value)
-                    else:
-                        result = doOperation(operand, self.value, othervalue)
-            else:
-                result = func.__call__(self, other)
-
-            if attr in WRAPPED_OPERATIONS:
-                return self.__class__(result)
-            else:
-                return result
-
-        operationwrapper.__qualname__ = attr
+        # Everything that only depends on the attribute is
+        # resolved here once instead of on every call.
+        operation = OPERATIONS[attr]
+        right = attr in RIGHT_OPERATIONS
+        unary = attr in UNARY_OPERATIONS
+        wrapped = attr in WRAPPED_OPERATIONS
+
+        # The function performing the operation on the values.
+        if unary:
+            opfunc = _UNOP.get(operation, None)
+        elif attr in AUGMENTED_OPERATIONS:
+            # Prefer the in-place operator (operator.iadd) and fall back to
+            # the binary operator for operations without one (/=, divmod()=)
+            opfunc = getattr(operator, attr, None) or _BINOP.get(operation[:-1], None)
+        else:
+            opfunc = _BINOP.get(operation, None)
+
+        if opfunc is None:
+            def opfunc(*args):
+                raise TypeError(f"unknown operation {operation}")
+
+        # A wrapper specialized for the kind of operation is returned, so that
+        # none of the above has to be checked when the operation is called.
+        # NOTE: Each wrapper starts with the same allowed check, it is repeated
+        # rather than moved into a function to avoid the extra call.
+        # The operator function, metaclass and builtins are captured as keyword-only
+        # default arguments so that they are locals rather than closure or global lookups.
+        # _allowed_operations is always a container, see _UNSET_OPERATIONS
+        if func is not None and unary:
+            def operationwrapper(self, other: Optional[Any]=None) -> Any:
+                if attr not in self._allowed_operations:
+                    return self._handle_restricted_operation(operation, other, right)
+
+                return func(self)
+
+        elif func is not None and wrapped:
+            def operationwrapper(self, other: Optional[Any]=None) -> Any:
+                if attr not in self._allowed_operations:
+                    return self._handle_restricted_operation(operation, other, right)
+
+                return self.__class__(func(self, other))
+
+        elif func is not None:
+            def operationwrapper(self, other: Optional[Any]=None) -> Any:
+                if attr not in self._allowed_operations:
+                    return self._handle_restricted_operation(operation, other, right)
+
+                return func(self, other)
+
+        elif unary:
+            def operationwrapper(self, other: Optional[Any]=None, *, _op=opfunc) -> Any:
+                if attr not in self._allowed_operations:
+                    return self._handle_restricted_operation(operation, other, right)
+
+                return _op(self.value)
+
+        elif right:
+            def operationwrapper(self, other: Optional[Any]=None, *, _op=opfunc, _meta=cls, _type=type) -> Any:
+                if attr not in self._allowed_operations:
+                    return self._handle_restricted_operation(operation, other, right)
+
+                # Every TypeWrapper class is created by this metaclass, checking
+                # the type of the class avoids walking the MRO with isinstance().
+                if _type(other).__class__ is _meta:
+                    other = other.value
+
+                return _op(other, self.value)
+
+        elif wrapped:
+            def operationwrapper(self, other: Optional[Any]=None, *, _op=opfunc, _meta=cls, _type=type) -> Any:
+                if attr not in self._allowed_operations:
+                    return self._handle_restricted_operation(operation, other, right)
+
+                if _type(other).__class__ is _meta:
+                    other = other.value
+
+                return self.__class__(_op(self.value, other))
+
+        else:
+            def operationwrapper(self, other: Optional[Any]=None, *, _op=opfunc, _meta=cls, _type=type) -> Any:
+                if attr not in self._allowed_operations:
+                    return self._handle_restricted_operation(operation, other, right)
+
+                if _type(other).__class__ is _meta:
+                    other = other.value
+
+                return _op(self.value, other)
+
         if func is not None:
-            operationwrapper.__doc__ = func.__doc__
-        operationwrapper.__func__ = func
+            functools.wraps(func)(operationwrapper)
+        else:
+            operationwrapper.__name__ = operationwrapper.__qualname__ = attr
+        operationwrapper.__rilow_wrapped__ = True
         return operationwrapper
 
     @classmethod
@@ -295,34 +435,52 @@ class _TypeWrapperMeta(type):
         Returns a magic method wrapper function for a class subclassing TypeWrapper as defined in MAGIC_METHODS.
         Used internally. Do not call.
         """
-        def magicmethodwrapper(self, *args: Any, **kwargs: Any) -> Any:
-            """
-            Internal magic method wrapper function.
-            """
-            if self.ALLOWED_OPERATIONS == COPY_OPERATIONS:
-                cls._getAllowedOperations(self)
-
-            if attr not in self.ALLOWED_OPERATIONS and (attr in MAGIC_METHOD_TO_FUNCTION and MAGIC_METHOD_TO_FUNCTION[attr] not in self.ALLOWED_OPERATIONS):
-                return self._handle_restricted_magic_method(attr, _default)
-
-            if func is None and attr in MAGIC_METHOD_TO_FUNCTION:
-                builtinFunc = MAGIC_METHOD_TO_FUNCTION[attr]
-                result = builtinFunc(self, *args, **kwargs)
-            elif func is None:
-                return self._handle_restricted_magic_method(attr, False) # set default to false for "not defined" message.
-            else:
-                result = func.__call__(self, *args, **kwargs)
+        builtinFunc = MAGIC_METHOD_TO_FUNCTION.get(attr, None)
+        wrapped = attr in WRAPPED_METHODS
 
-            if attr in WRAPPED_METHODS:
-                return self.__class__(result)
-            else:
-                return result
+        # As with the operation wrappers the function to call is resolved here
+        # rather than on every call.
+        # NOTE: Args are passed through, so the function is read from the closure
+        # rather than a default argument which a keyword argument could replace.
+        if func is not None:
+            def magicmethodwrapper(self, *args: Any, **kwargs: Any) -> Any:
+                """
+                Internal magic method wrapper function.
+                """
+                if attr not in self._allowed_operations:
+                    return self._handle_restricted_magic_method(attr, _default)
+
+                result = func(self, *args, **kwargs)
+                return self.__class__(result) if wrapped else result
+
+        elif builtinFunc is not None:
+            def magicmethodwrapper(self, *args: Any, **kwargs: Any) -> Any:
+                """
+                Internal magic method wrapper function.
+                """
+                if attr not in self._allowed_operations:
+                    return self._handle_restricted_magic_method(attr, _default)
+
+                # The builtin is called on the value, calling it on self would
+                # only call this wrapper again.
+                result = builtinFunc(self.value, *args, **kwargs)
+                return self.__class__(result) if wrapped else result
+
+        else:
+            def magicmethodwrapper(self, *args: Any, **kwargs: Any) -> Any:
+                """
+                Internal magic method wrapper function.
+                """
+                if attr not in self._allowed_operations:
+                    return self._handle_restricted_magic_method(attr, _default)
 
+                return self._handle_restricted_magic_method(attr, False) # set default to false for "not defined" message.
 
-        magicmethodwrapper.__qualname__ = attr
         if func is not None:
-            magicmethodwrapper.__doc__ = func.__doc__
-        magicmethodwrapper.__func__ = func
+            functools.wraps(func)(magicmethodwrapper)
+        else:
+            magicmethodwrapper.__name__ = magicmethodwrapper.__qualname__ = attr
+        magicmethodwrapper.__rilow_wrapped__ = True
         return magicmethodwrapper
 
     def __new__(cls: Type, name: str, bases: Tuple, attrs: Dict[str, Any]) -> Type:
@@ -331,51 +489,82 @@ class _TypeWrapperMeta(type):
         """
         klass = type.__new__(cls, name, bases, attrs)
 
-        typewrapper = klass if "TypeWrapper" not in globals() else TypeWrapper
-
-        for name in MAGIC_NAMES:
-            if name in OPERATIONS and name not in TYPEWRAPPER_IGNORED_ATTRIBUTES:
-                _default = name in attrs
-                wrapper = cls._getOperationWrapper(name, getattr(klass, name, None), _default)
-                setattr(klass, name, wrapper)
-            elif name in MAGIC_METHODS and name not in TYPEWRAPPER_IGNORED_ATTRIBUTES:
-                _default = name in MAGIC_METHODS
-                wrapper = cls._getMagicMethodWrapper(name, getattr(klass, name, None), _default)
-                setattr(klass, name, wrapper)
-
-        # For every attribute we create wrappers on operations and magic methods.
+        if "TypeWrapper" not in globals():
+            # The base TypeWrapper wraps every magic name.
+            typewrapper = klass
+            names = MAGIC_NAMES
+        else:
+            # Subclasses inherit the base wrappers, so only the
+            # names they override need to be wrapped again.
+            typewrapper = TypeWrapper
+            names = MAGIC_NAMES & attrs.keys()
+
+        for magic in names:
+            if getattr(attrs.get(magic), "__rilow_wrapped__", False):
+                # Already a wrapper (eg. __radd__ = TypeWrapper.__add__), wrapping
+                # it again would only stack another allowed check on the call.
+                continue
+            elif magic in OPERATIONS and magic not in TYPEWRAPPER_IGNORED_ATTRIBUTES:
+                _default = magic in attrs
+                wrapper = cls._getOperationWrapper(magic, getattr(klass, magic, None), _default)
+                setattr(klass, magic, wrapper)
+            elif magic in MAGIC_METHODS and magic not in TYPEWRAPPER_IGNORED_ATTRIBUTES:
+                _default = magic in MAGIC_METHODS
+                wrapper = cls._getMagicMethodWrapper(magic, getattr(klass, magic, None), _default)
+                setattr(klass, magic, wrapper)
+
+        copymode = klass.ALLOWED_OPERATIONS is COPY_OPERATIONS or klass.ALLOWED_OPERATIONS is COPY_OPERATIONS_ONCE
+
+        if copymode:
+            if klass.ALLOWED_OPERATIONS is COPY_OPERATIONS and not klass.__dictoffset__:
+                raise TypeError(f"'{klass.__qualname__}' uses COPY_OPERATIONS which needs an instance __dict__, "
+                                "add '__dict__' to its __slots__ or use COPY_OPERATIONS_ONCE")
+
+            # Populated by TypeWrapper.__init__ through _getAllowedOperations()
+            klass._allowed_operations = _UNSET_OPERATIONS
+            return klass
+
+        # If the attribute is a magic name and there is a NEWLY DEFINED function eg. overriding TypeWrapper method,
+        # and that said method is not in ALLOWED_OPERATIONS then add it.
+        allowed = frozenset(klass.ALLOWED_OPERATIONS)
+        added = set()
         for attr in attrs:
-            func = attrs[attr]
-
-            # If the attribute is a magic name and there is a NEWLY DEFINED function eg. overriding TypeWrapper method,
-            # and that said method is not in ALLOWED_OPERATIONS then add it.
-            if klass.ALLOWED_OPERATIONS != COPY_OPERATIONS and attr in MAGIC_NAMES and getattr(typewrapper, attr, None) != func and attr not in klass.ALLOWED_OPERATIONS:
+            if attr in MAGIC_NAMES and getattr(typewrapper, attr, None) != attrs[attr] and attr not in allowed:
                 # Add operand if available otherwise add the attribute.
-                klass.ALLOWED_OPERATIONS.append(OPERATIONS.get(attr, attr))
-
-            if attr in OPERATIONS:
-                attrs[attr] = cls._getOperationWrapper(attr, func)
-                continue
-            elif attr in MAGIC_METHODS:
-                attrs[attr] = cls._getMagicMethodWrapper(attr, func)
-                continue
-
+                added.add(OPERATIONS.get(attr, attr))
 
+        klass.ALLOWED_OPERATIONS = allowed.union(added) if added else allowed
+        klass._allowed_operations = cls._resolveAllowedOperations(klass.ALLOWED_OPERATIONS)
         return klass
 
 class TypeWrapper(metaclass=_TypeWrapperMeta):
-    ALLOWED_OPERATIONS = []
+    # Subclasses can set ALLOWED_OPERATIONS to any iterable of magic names, operands
+    # and builtin functions (or a COPY mode), it is normalized to a frozenset.
+    ALLOWED_OPERATIONS = frozenset()
+
+    # NOTE: Subclasses without __slots__ still get a __dict__, which COPY_OPERATIONS
+    # needs as it stores the allowed operations on the instance.
+    __slots__ = ("type", "value", "__weakref__")
 
     def __init__(self, value: T=None, type: Type[T]=None):
         # If type is none then do not type restrict the value.
         self.type: Type[T] = type
         self.value: T = value
 
+        # The COPY modes copy the allowed operations from the value, this is done
+        # here once so that the wrapped operations never have to check for it.
+        # NOTE: Subclasses using a COPY mode must call TypeWrapper.__init__
+        if self._allowed_operations is _UNSET_OPERATIONS:
+            _TypeWrapperMeta._getAllowedOperations(self)
+
     def _handle_restricted_operation(self, operand: str, other: Optional[Any]=None, right: bool=False) -> None:
         """
         This is called internally by _TypeWrapperMeta when a operation is attempted that
         is not allowed.
         """
+        if self._allowed_operations is _UNSET_OPERATIONS:
+            raise _uninitializedError(self)
+
         qualname = self.__class__.__qualname__
         otherqualname = other.__class__.__qualname__
         if other is None:
@@ -397,6 +586,9 @@ class TypeWrapper(metaclass=_TypeWrapperMeta):
         This is called internally by _TypeWrapperMeta when a magic method is attempted to be 
         called which is not allowed to be.
         """
+        if self._allowed_operations is _UNSET_OPERATIONS:
+            raise _uninitializedError(self)
+
         if default:
             raise TypeError(f"could not call magic method '{name}'")
         else:
@@ -408,9 +600,13 @@ class TypeWrapper(metaclass=_TypeWrapperMeta):
 
     def __getattr__(self, attr):
         # Called on missing attributes. Will attempt to return the attribute of the value.
-        r = getattr(self.value, attr, None)
+        if attr == "value":
+            # The value slot is unset, getting it here would only recurse.
+            raise AttributeError(f"'{self.__class__.__qualname__}' object has no attribute 'value'")
+
+        r = getattr(self.value, attr, _MISSING)
 
-        if not r:
+        if r is _MISSING:
             raise AttributeError(f"'{self.value.__class__.__qualname__}' object has no attribute '{attr}'")
         return r
 
@@ -470,10 +666,34 @@ if __name__ == "__main__":
     f2 = MyOtherOtherTypeWrapper(4)
     print(f2+2)
 
-    # Notice its still set to `1`  the value of COPY_OPERATIONS because
+    # Notice its still set to COPY_OPERATIONS because
     # the operations are copied per instance. not per class as COPY_OPERATIONS_ONCE is (above)
     print(MyOtherOtherTypeWrapper.ALLOWED_OPERATIONS)
 
     f3 = MyTypeWrapper(2)
     f3 += 2
-    print(f3, f3.__class__)
\ No newline at end of file
+    print(f3, f3.__class__)
+
+    # COPY_OPERATIONS stores the operations on the instance, so it needs a __dict__
+    try:
+        class MySlottedTypeWrapper(TypeWrapper):
+            ALLOWED_OPERATIONS = COPY_OPERATIONS
+            __slots__ = ()
+
+            def __add__(self, other):
+                return self.value + other
+        print("This should have raised an error!")
+    except TypeError as exc:
+        print(f"{exc.__class__.__qualname__}: {exc}")
+
+    class MyUninitializedTypeWrapper(TypeWrapper):
+        ALLOWED_OPERATIONS = COPY_OPERATIONS_ONCE
+
+        def __init__(self, value):
+            self.value = value
+
+    try:
+        print(MyUninitializedTypeWrapper(4) + 2)
+        print("This should have raised an error!")
+    except TypeError as exc:
+        print(f"{exc.__class__.__qualname__}: {exc}")
\ No newline at end of file
@@ -4,7 +4,6 @@ Copyright (c) 2022 Rilow, All rights reserved.
 Name: typed.py
 Description: strict typed functions in python
 """
-from functools import partial as _partial
 import typing
 import types
 from types import CodeType, FunctionType, MethodType, WrapperDescriptorType
@@ -13,21 +12,17 @@ import sys
 # Set this True for debug messages
 __DEBUG__ = False
 
-def _getArgNames(co: types.CodeType) -> typing.List[str]:
+def _getArgNames(co: types.CodeType) -> typing.Tuple[str, ...]:
     """
-    Retruns a list of all argument names
+    Retruns a tuple of all argument names
     for a given code object.
     e.g.
     >>> def test(x: int): ...
     >>> _getArgNames(test.__code__)
-    ["x"]
+    ("x",)
     """
-    names = co.co_varnames
-    nargs = co.co_argcount
-    nkwargs = co.co_kwonlyargcount
-    args = list(names[:nargs])
-    kwonlyargs = list(names[nargs:nargs+nkwargs])
-    return args + kwonlyargs
+    # co_varnames starts with the positional args followed by the keyword only args.
+    return co.co_varnames[:co.co_argcount + co.co_kwonlyargcount]
 
 def _getArgs(x: typing.Any) -> typing.Tuple:
     """
@@ -68,26 +63,19 @@ def _getTypeName(x: typing.Any) -> str:
 
     # typing.Union -> Always has args, any amount
     elif _isUnion(x):
-        return str(tuple([_getTypeName(arg) for arg in x.__args__]))
+        return "(" + ", ".join([_getTypeName(arg) for arg in x.__args__]) + ")"
 
     # typing.List -> Optional args, any amount
     elif _isList(x):
         args = _getArgs(x)
-        s = "List["
         if args:
-            s += f"{args[0]}]"
-        else:
-            s += "]"
-        return s
+            return f"List[{_getTypeName(args[0])}]"
+        return "List[]"
 
     # typing.Tuple -> Optional args, any amount
     elif _isTuple(x):
         args = _getArgs(x)
-        s = "Tuple["
-        for arg in args:
-            s += f"{_getTypeName(arg)}, "
-        s = s[:len(s)-2] # remove comma and trailing whitespace
-        return s + "]"
+        return "Tuple[" + ", ".join([_getTypeName(arg) for arg in args]) + "]"
 
     # typing.Dict -> Optional args, always has 2 if present
     elif _isDict(x):
@@ -193,44 +181,47 @@ def _isString(x: typing.Any) -> bool:
     """
     Returns True if x is a string.
     """
-    try:
-        return isinstance(x, str) or x == str
-    except:
-        return False
+    return isinstance(x, str)
 
-def _typecheck(v: typing.Any, t: typing.Type) -> bool:
+# Kinds of annotations. Annotations are classified once by _classify() so
+# that checking a value only has to compare the kind instead of going
+# through all of the _is* functions for every check.
+_KIND_INSTANCE = 0 # isinstance(v, t)
+_KIND_ANY = 1 # Matches everything
+_KIND_NONE = 2 # v is None
+_KIND_UNION = 3 # Matches one of the classified args
+_KIND_LIST = 4
+_KIND_TUPLE = 5
+_KIND_DICT = 6
+_KIND_NORETURN = 7
+
+def _classify(t: typing.Any) -> typing.Tuple[int, typing.Any]:
     """
-    Checks if the value `v` matches the type `t`.
-    Returns False if the types do not match otherwise True.
+    Returns the kind of the type `t` and its payload.
+    The payload of container types holds their classified args
+    (or None if they have none) otherwise it is the type itself.
     """
-    # Use a check flag here for each case with a value of None.
-    # If the flag isn't set before the return then
-    # a final instance check occurs. Note that any typing
-    # objects (subscriptable ones) will cause an exception
-    # on the instance check.
-    check = None
-
     # typing.Any -> matches everything
     if t == typing.Any:
-        check = True
+        return (_KIND_ANY, None)
 
-    # typing.NoReturn -> This should never be triggered (NoReturn should exit before a typecheck on a return)
+    # typing.NoReturn -> This should never be checked (NoReturn should exit before a typecheck on a return)
     elif t == typing.NoReturn:
-        raise RuntimeError("NoReturn should not be accessed by the typed wrapper")
+        return (_KIND_NORETURN, None)
 
     # types.NoneType -> Ensure the value is None
     elif t is None or t == type(None):
-        check = v is None
+        return (_KIND_NONE, None)
 
     # typing.Type -> Only care about type checking if there is a type associated with it.
     elif _isType(t):
         args = _getArgs(t)
 
         if len(args) == 0:
-            check = True
+            return (_KIND_ANY, None)
         else:
             # Check the associated type
-            check = _typecheck(v, args[0])
+            return _classify(args[0])
 
     # typing.TypeVar -> Only care about type checking if there is a bound type
     elif _isTypeVar(t):
@@ -243,73 +234,46 @@ def _typecheck(v: typing.Any, t: typing.Type) -> bool:
         bound = _getBound(t)
 
         if bound:
-            check = _typecheck(v, bound)
+            return _classify(bound)
         else:
-            check = True
+            return (_KIND_ANY, None)
 
     # type (builtins.type) -> Builtin type means any type could be parsed as this value so its always True
     elif _isBuiltinType(t):
-        check = True
+        return (_KIND_ANY, None)
 
     # typing.Union -> Check the value is one of the types in the union
     # NOTE: Optional[...] == Union[..., None]
     elif _isUnion(t):
-        check = False
-
         # Unions will always have args
-        for type_ in t.__args__:
-            x = _typecheck(v, type_)
-            if x:
-                check = True
-                break
+        kinds = tuple([_classify(type_) for type_ in t.__args__])
+
+        # A union of plain classes (eg. Optional[int]) can be checked with
+        # a single isinstance call on a tuple of the classes.
+        types_ = []
+        for kind, payload in kinds:
+            if kind == _KIND_INSTANCE and isinstance(payload, type):
+                types_.append(payload)
+            elif kind == _KIND_NONE:
+                types_.append(type(None))
+            else:
+                return (_KIND_UNION, kinds)
+        return (_KIND_INSTANCE, tuple(types_))
 
     # typing.List -> Check that all items match the type. (Lists have one arg (if present))
     elif _isList(t):
         args = _getArgs(t)
-
-        if not isinstance(v, list):
-            check = False
-
-        elif not args:
-            check = True
-
-        else:
-            check = all([_typecheck(x, args[0]) for x in v])
+        return (_KIND_LIST, _classify(args[0]) if args else None)
 
     # typing.Tuple -> Check length and type, order matters!
     elif _isTuple(t):
         args = _getArgs(t)
-
-        if not isinstance(v, tuple):
-            check = False
-
-        elif not args:
-            check = True
-
-        elif len(args) != len(v):
-            check = False
-
-        else:
-            check = True
-
-            for i in range(len(args)):
-                if not _typecheck(v[i], args[i]):
-                    check = False
+        return (_KIND_TUPLE, tuple([_classify(arg) for arg in args]) if args else None)
 
     # typing.Dict -> Check key type and value type
     elif _isDict(t):
         args = _getArgs(t)
-
-        if not isinstance(v, dict):
-            check = False
-        else:
-            keyType = args[0]
-            valType = args[1]
-            keys = tuple(v.keys())
-            vals = tuple(v.values())
-            keysCheck = all([_typecheck(key, keyType) for key in keys])
-            valsCheck = all([_typecheck(val, valType) for val in vals])
-            check = keysCheck and valsCheck
+        return (_KIND_DICT, (_classify(args[0]), _classify(args[1])) if args else None)
 
     # typing.Callable
     # NOTE: Normally callables are wrapped into _TypedWrapper
@@ -317,25 +281,132 @@ def _typecheck(v: typing.Any, t: typing.Type) -> bool:
     # it into this if statement are only those which are subscripted
     # (not generic `Callable` or the wrapped ones.) Simply return True.
     elif _isCallable(t):
-        return True
+        return (_KIND_ANY, None)
 
     elif _isString(t):
         # Strings (representive retruns like)
         # def getUser(someargs) -> "User": ...
         # are handled here. They are always true because
         # they are basically just a type var without an arg.
-        check = True
+        return (_KIND_ANY, None)
 
-    # If not value has been set for the check then perform an instance check
-    if check is None:
-        check = isinstance(v, t)
+    # Unsubscripted typing aliases (typing.Iterable, typing.Callable, ...) check
+    # against their origin class, checking the origin directly skips the
+    # alias' __instancecheck__.
+    # HACKHACK: Accessing private class of the typing module
+    elif isinstance(t, typing._SpecialGenericAlias):
+        return (_KIND_INSTANCE, typing.get_origin(t))
+
+    # Otherwise perform an instance check. Note that any typing
+    # objects (subscriptable ones) will cause an exception
+    # on the instance check.
+    return (_KIND_INSTANCE, t)
+
+def _checkKind(v: typing.Any, kind: int, payload: typing.Any) -> bool:
+    """
+    Checks if the value `v` matches a type classified by _classify().
+    Returns False if the types do not match otherwise True.
+    """
+    if kind == _KIND_INSTANCE:
+        return isinstance(v, payload)
+
+    elif kind == _KIND_ANY:
+        return True
+
+    elif kind == _KIND_NONE:
+        return v is None
+
+    elif kind == _KIND_UNION:
+        for k, p in payload:
+            if _checkKind(v, k, p):
+                return True
+        return False
+
+    elif kind == _KIND_LIST:
+        if not isinstance(v, list):
+            return False
+        elif payload is None:
+            return True
+
+        # Stop at the first item that doesn't match.
+        k, p = payload
+        if k == _KIND_INSTANCE:
+            # Items of a plain class are checked without a call to _checkKind for each.
+            for x in v:
+                if not isinstance(x, p):
+                    return False
+            return True
+
+        for x in v:
+            if not _checkKind(x, k, p):
+                return False
+        return True
+
+    elif kind == _KIND_TUPLE:
+        if not isinstance(v, tuple):
+            return False
+        elif payload is None:
+            return True
+        elif len(payload) != len(v):
+            return False
+
+        for (k, p), x in zip(payload, v):
+            if not _checkKind(x, k, p):
+                return False
+        return True
+
+    elif kind == _KIND_DICT:
+        if not isinstance(v, dict):
+            return False
+        elif payload is None:
+            return True
+
+        (keyKind, keyPayload), (valKind, valPayload) = payload
+        if keyKind == _KIND_INSTANCE and valKind == _KIND_INSTANCE:
+            for key, val in v.items():
+                if not isinstance(key, keyPayload) or not isinstance(val, valPayload):
+                    return False
+            return True
+
+        for key, val in v.items():
+            if not _checkKind(key, keyKind, keyPayload) or not _checkKind(val, valKind, valPayload):
+                return False
+        return True
+
+    else: # _KIND_NORETURN
+        raise RuntimeError("NoReturn should not be accessed by the typed wrapper")
+
+def _debugCheck(v: typing.Any, t: typing.Type, check: bool) -> None:
+    """
+    Prints the result of a type check, used when __DEBUG__ is True.
+    """
+    print("[CHCKD]:", f"val={v}", f"type={_getTypeName(v.__class__)}", f"excpected={_getTypeName(t)}", f"result={check}")
+
+def _typecheck(v: typing.Any, t: typing.Type) -> bool:
+    """
+    Checks if the value `v` matches the type `t`.
+    Returns False if the types do not match otherwise True.
+    """
+    # An exact type match always passes, skip classifying the type.
+    if type(v) is t:
+        check = True
+    else:
+        check = _checkKind(v, *_classify(t))
 
     if __DEBUG__:
-        print("[CHCKD]:", f"val={v}", f"type={_getTypeName(v.__class__)}", f"excpected={_getTypeName(t)}", f"result={check}")
+        _debugCheck(v, t, check)
 
     return check
 
 class _TypedWrapper:
+    # __doc__, __name__ and __qualname__ are copied from the wrapped function.
+    __slots__ = (
+        "func", "name", "__doc__", "__name__", "__qualname__", "wrap_callables",
+        "args", "annotations", "kinds", "checks",
+        "return_type", "_return_type_name", "return_kind",
+        "__weakref__",
+    )
+
     @classmethod
     def from_class(cls, klass: type) -> '_TypedWrapper':
         """
@@ -346,21 +417,20 @@ class _TypedWrapper:
         # Get methods from klass
         methods = []
 
-        attrs = dir(klass)
-        for attr in attrs:
+        # NOTE: dir() is used rather than klass.__dict__ so that inherited methods are wrapped too.
+        for attr in dir(klass):
+            # Mostly we don't wrap dunder methods but for __init__ we make an exception.
+            if attr.startswith("__") and attr != "__init__":
+                continue
+
+            # Exact type checks, a descriptor wrapper (eg. object.__init__)
+            # is neither so it is never wrapped.
             x = getattr(klass, attr)
-            if isinstance(x, (types.MethodType, types.FunctionType)) and not attr.startswith("__"):
+            t = type(x)
+            if t is FunctionType or t is MethodType:
                 methods.append(x)
 
-        # Mostly we don't wrap dunder methods but for __init__ we make an exception.
-        if "__init__" in attrs:
-            methods.append(getattr(klass, "__init__"))
-
         for method in methods:
-            # Cannot wrap a descriptro wrapper
-            if isinstance(method, types.WrapperDescriptorType):
-                continue
-
             typedmethod = typed(method)
 
             # Add the typedmethod to the class
@@ -459,6 +529,16 @@ class _TypedWrapper:
         Internal method to set the annotations.
         """
         self.annotations = annotations
+
+        # Classify the annotations once for the checks on every call.
+        self.kinds = {name: _classify(t) for name, t in annotations.items()}
+
+        # The positional args that are checked as (index, name, kind, payload),
+        # args annotated with Any (or not annotated at all) are skipped.
+        self.checks = tuple([
+            (i, name) + self.kinds[name] for i, name in enumerate(self.args)
+            if self.kinds[name][0] != _KIND_ANY
+        ])
         return self
 
     def _setReturnType(self, return_type):
@@ -466,13 +546,24 @@ class _TypedWrapper:
         Internal method to set the return type.
         """
         self.return_type = return_type
-        self.return_type_name = _getTypeName(self.return_type)
+        self._return_type_name = None
+        self.return_kind = _classify(return_type)
 
         # Add to annotations if not already there
         if hasattr(self, "annotations") and ("return" not in self.annotations or self.annotations["return"] != return_type):
             self.annotations["return"] = return_type
         return self
 
+    @property
+    def return_type_name(self) -> str:
+        """
+        The name of the return type.
+        Only looked up when first needed as it is mostly used for errors.
+        """
+        if self._return_type_name is None:
+            self._return_type_name = _getTypeName(self.return_type)
+        return self._return_type_name
+
     def _setFunc(self, func):
         self.func = func
 
@@ -501,30 +592,63 @@ class _TypedWrapper:
             return self.__class__.from_callable(ret, self.return_type)
 
         # Perform a typecheck on the returned value
-        if _typecheck(ret, self.return_type):
+        kind, payload = self.return_kind
+        if kind == _KIND_ANY:
+            if __DEBUG__:
+                _debugCheck(ret, self.return_type, True)
+            return ret
+        elif kind == _KIND_INSTANCE:
+            check = isinstance(ret, payload)
+        else:
+            check = _checkKind(ret, kind, payload)
+
+        if __DEBUG__:
+            _debugCheck(ret, self.return_type, check)
+
+        if check:
             return ret
         else:
             raise TypeError("Function '%s' must return type '%s'" % (self.name, self.return_type_name))
 
     def __get__(self, x, t):
         """
-        Allows for instance binding (partial function)
+        Allows for instance binding (bound method)
         """
-        return _partial(self.__call__, x)
+        if x is None:
+            # Accessed on the class, eg. Class.method(instance)
+            return self
+
+        # A bound method is a single allocation which calls the wrapper
+        # directly, a partial of self.__call__ also had to bind __call__.
+        return MethodType(self, x)
 
     def typedfunc(self, args, kwargs):
         """
         Performs type checking on args and then calls the function.
         """
-        argzip = dict(zip(self.args, args))
+        nargs = len(args)
 
-        for arg in argzip:
+        for i, arg, kind, payload in self.checks:
+            if i >= nargs:
+                # The checks are in order, the rest of the args were not passed.
+                break
+
+            val = args[i]
             if __DEBUG__:
-                val = argzip[arg]
                 expected = self.annotations[arg]
                 print("[CHECK]:", f"{arg=}", f"{val=}", f"type={_getTypeName(val.__class__)}", f"expected={_getTypeName(expected)}")
 
-            if not _typecheck(argzip[arg], self.annotations[arg]):
+            # Plain classes are checked here rather than through _checkKind to save a call.
+            if kind == _KIND_INSTANCE:
+                check = isinstance(val, payload)
+            else:
+                check = _checkKind(val, kind, payload)
+
+            if __DEBUG__:
+                _debugCheck(val, expected, check)
+
+            if not check:
+                # The type name is only needed for the error.
                 typename = _getTypeName(self.annotations[arg])
                 raise TypeError("Function '%s' argument '%s' must be type '%s'" % (self.name, arg, typename))
 
@@ -11,6 +11,10 @@ from rtypes import TypeWrapper, ALL_OPERATIONS, doOperation
 Number = Union[int, float, complex]
 NumberTypes = (int, float, complex)
 
+# The default bounds of clamp.
+_INF = float("inf")
+_NEG_INF = float("-inf")
+
 __all__ = [
 	"ClampedInt",
 	"forEach",
@@ -23,12 +27,20 @@ __all__ = [
 class ClampedInt(TypeWrapper):
 	ALLOWED_OPERATIONS = ALL_OPERATIONS
 
+	__slots__ = ("min", "max", "_value")
+
 	def __init__(self, x: int=0, min: Optional[int]=None, max: Optional[int]=None):
 		self.min = min
 		self.max = max
 
-		if self.min is None: self.min = float("-inf")
-		if self.max is None: self.max = float("inf")
+		if self.min is None: self.min = _NEG_INF
+		if self.max is None: self.max = _INF
+
+		# The bounds are only checked here, the value setter relies on them.
+		if not isinstance(self.min, NumberTypes):
+			raise TypeError("min must be a number")
+		elif not isinstance(self.max, NumberTypes):
+			raise TypeError("max must be a number")
 
 		if self.min > self.max:
 			# Swap
@@ -47,9 +59,14 @@ class ClampedInt(TypeWrapper):
 	@value.setter
 	def value(self, value):
 		if isinstance(value, ClampedInt):
-			value = value.value
+			value = value._value
 
-		self._value = clamp(value, self.min, self.max)
+		# Clamp directly rather than through clamp() which checks the bounds again.
+		if value < self.min:
+			value = self.min
+		elif value > self.max:
+			value = self.max
+		self._value = value
 
 class Singleton:
 	__singleton_instances__: Dict[Type, object] = {}
@@ -62,18 +79,23 @@ class Singleton:
 		return instances[cls]
 		
 def forEach(i: Iterable, func: Callable) -> None:
-	if not isinstance(i, Iterable):
-		raise TypeError("i must be iterable")
-	elif not callable(func):
+	# Get the iterator directly rather than isinstance(i, Iterable)
+	# which goes through the ABC instance check.
+	try:
+		it = iter(i)
+	except TypeError:
+		raise TypeError("i must be iterable") from None
+
+	if not callable(func):
 		raise TypeError(f"{func} is not callable")
 
-	for x in i:
+	for x in it:
 		func(x)
 	return
 
 def clamp(x: Number, min_: Optional[Number]=None, max_: Optional[Number]=None) -> Number:
-	if min_ is None: min_ = float("-inf")
-	if max_ is None: max_ = float("inf")
+	if min_ is None: min_ = _NEG_INF
+	if max_ is None: max_ = _INF
 
 	if not isinstance(x, NumberTypes):
 		raise TypeError("x must be a number")
@@ -84,4 +106,9 @@ def clamp(x: Number, min_: Optional[Number]=None, max_: Optional[Number]=None) -
 	elif min_ > max_:
 		raise ValueError("Minimum value cannot be greater than maximum value")
 
-	return max(min(x, max_), min_)
+	# Compare directly rather than max(min(x, max_), min_) which makes two builtin calls.
+	if x < min_:
+		return min_
+	elif x > max_:
+		return max_
+	return x